@@ -10,11 +10,12 @@ Usage:
     gam down <stack|--all> [-c CAT] [-t TAG]
     gam logs [stack...] [--all] [-c CAT] [-t TAG] [-f] [--since TIME]
              [-n NUM] [-T] [--until TIME]
-    gam ls [-c|--category=CAT] [-t|--tag=TAG]
-    gam restart <stack|--all> [-c CAT] [-t TAG]
-    gam search <term>
+    gam ls [-c|--category=CAT] [-t|--tag=TAG] [--deep-scan]
+    gam restart <stack|--all> [-c CAT] [-t TAG] [--hard]
+    gam search <term> [<term> ...]
+    gam shell
     gam show <stack>
-    gam status [-c|--category=CAT] [-t|--tag=TAG]
+    gam status [-c|--category=CAT] [-t|--tag=TAG] [--deep-scan]
     gam tag add <stack> <tag> [<tag> ...]
     gam tag ls
     gam tag remove <stack> <tag> [<tag> ...]
@@ -25,25 +26,39 @@ Usage:
 
 import argparse
 import sys
+from collections.abc import Callable
 
-from .commands import (
-    cmd_autostart,
-    cmd_category,
-    cmd_down,
-    cmd_logs,
-    cmd_ls,
-    cmd_restart,
-    cmd_search,
-    cmd_show,
-    cmd_status,
-    cmd_tag,
-    cmd_up,
-    cmd_validate,
-)
+from . import commands
 from .stack_manager import StackManager
 
-
-def main():
+# Command handler names by subcommand name, including aliases. Handlers
+# are looked up with get_command() so only the one that runs is imported.
+COMMANDS = {
+    'autostart': 'cmd_autostart',
+    'category': 'cmd_category',
+    'cat': 'cmd_category', # Alias for category
+    'down': 'cmd_down',
+    'list': 'cmd_ls',  # Alias for ls
+    'logs': 'cmd_logs',
+    'ls': 'cmd_ls',
+    'restart': 'cmd_restart',
+    'search': 'cmd_search',
+    'shell': 'cmd_shell',
+    'show': 'cmd_show',
+    'status': 'cmd_status',
+    'tag': 'cmd_tag',
+    'up': 'cmd_up',
+    'validate': 'cmd_validate',
+}
+
+
+def get_command(name: str) -> Callable:
+    """Return the handler for a subcommand, importing its module."""
+    return getattr(commands, COMMANDS[name])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all gam commands."""
     parser = argparse.ArgumentParser(
         description="Docker Compose Stack Manager",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -141,6 +156,10 @@ def main():
         '-c', '--category', help='Filter by category'
     )
     ls_parser.add_argument('-t', '--tag', help='Filter by tag')
+    ls_parser.add_argument(
+        '--deep-scan', action='store_true',
+        help='Also find stacks nested inside other stacks'
+    )
 
     # restart
     restart_parser = subparsers.add_parser('restart', help='Restart stack(s)')
@@ -156,10 +175,21 @@ def main():
     restart_parser.add_argument(
         '-t', '--tag', help='Restart all stacks with tag'
     )
+    restart_parser.add_argument(
+        '--hard', action='store_true',
+        help='Recreate containers with down and up'
+    )
 
     # search
     search_parser = subparsers.add_parser('search', help='Search stacks')
-    search_parser.add_argument('term', help='Search term')
+    search_parser.add_argument(
+        'terms', nargs='+', help='Search term(s), all must match'
+    )
+
+    # shell
+    subparsers.add_parser(
+        'shell', help='Run commands from stdin without rescanning'
+    )
 
     # show
     show_parser = subparsers.add_parser('show', help='Show stack details')
@@ -173,6 +203,10 @@ def main():
         '-c', '--category', help='Filter by category'
     )
     status_parser.add_argument('-t', '--tag', help='Filter by tag')
+    status_parser.add_argument(
+        '--deep-scan', action='store_true',
+        help='Also find stacks nested inside other stacks'
+    )
 
     # tag
     tag_parser = subparsers.add_parser('tag', help='Manage tags')
@@ -235,6 +269,11 @@ def main():
         'target', nargs='?', help='Stack name or category'
     )
 
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -242,27 +281,10 @@ def main():
         sys.exit(1)
 
     # Initialize manager
-    manager = StackManager()
+    manager = StackManager(deep_scan=getattr(args, 'deep_scan', False))
 
     # Dispatch to command
-    commands = {
-        'autostart': cmd_autostart,
-        'category': cmd_category,
-        'cat': cmd_category, # Alias for category
-        'down': cmd_down,
-        'list': cmd_ls,  # Alias for ls
-        'logs': cmd_logs,
-        'ls': cmd_ls,
-        'restart': cmd_restart,
-        'search': cmd_search,
-        'show': cmd_show,
-        'status': cmd_status,
-        'tag': cmd_tag,
-        'up': cmd_up,
-        'validate': cmd_validate,
-    }
-
-    commands[args.command](manager, args)
+    get_command(args.command)(manager, args)
 
 
 if __name__ == '__main__':
@@ -1,17 +1,10 @@
-"""Command handlers for gam CLI."""
+"""Command handlers for gam CLI.
 
-from .autostart import cmd_autostart
-from .category import cmd_category
-from .down import cmd_down
-from .logs import cmd_logs
-from .ls import cmd_ls
-from .restart import cmd_restart
-from .search import cmd_search
-from .show import cmd_show
-from .status import cmd_status
-from .tag import cmd_tag
-from .up import cmd_up
-from .validate import cmd_validate
+Each handler lives in its own module, imported on first access so a
+command only pays for the modules it uses.
+"""
+
+import importlib
 
 __all__ = [
     'cmd_autostart',
@@ -21,9 +14,18 @@ __all__ = [
     'cmd_ls',
     'cmd_restart',
     'cmd_search',
+    'cmd_shell',
     'cmd_show',
     'cmd_status',
     'cmd_tag',
     'cmd_up',
     'cmd_validate',
 ]
+
+
+def __getattr__(name: str):
+    """Import a command handler's module on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name[len('cmd_'):]}", __name__)
+    return getattr(module, name)
@@ -11,9 +11,14 @@ def cmd_autostart(manager: StackManager, args) -> None:
 
     print(f"Auto-starting {len(stacks)} stack(s) by priority...\n")
 
-    for stack in stacks:
-        print(f"  [{stack.priority}] Starting {stack.name}...", end=" ")
-        if stack.up():
-            print("✓")
-        else:
-            print("✗ FAILED")
+    # Each priority starts in dependency order, independent stacks together.
+    for batch in manager.batch_stacks(stacks, by_priority=True):
+        # Capture output when several stacks run at once.
+        quiet = len(batch) > 1
+        results = manager.run_batch(batch, lambda s: s.up(quiet=quiet))
+        for stack, ok in zip(batch, results):
+            manager.invalidate_status(stack)
+            print(
+                f"  [{stack.priority}] Starting {stack.name}...",
+                "✓" if ok else "✗ FAILED"
+            )
@@ -16,8 +16,8 @@ def cmd_category(manager: StackManager, args) -> None:
         for category, subcategory in categories:
             # Count how many stacks use this category
             count = sum(
-                1 for s in manager.stacks.values()
-                if s.category == category and s.subcategory == subcategory
+                1 for s in manager.get_category_stacks(category)
+                if s.subcategory == subcategory
             )
 
             display = (
@@ -32,22 +32,15 @@ def cmd_category(manager: StackManager, args) -> None:
             print(f"Stack '{args.stack}' not found")
             sys.exit(1)
 
-        if stack.subcategory:
-            old_category = f"{stack.category}/{stack.subcategory}"
-        else:
-            old_category = stack.category
-
+        old_category = stack.category_display
         stack.category = args.new_category
         stack.subcategory = args.subcategory or ""
         stack.save_metadata()
+        manager.invalidate_indexes()
 
-        if stack.subcategory:
-            new_category = f"{stack.category}/{stack.subcategory}"
-        else:
-            new_category = stack.category
         msg = (
             f"✓ Changed category for {stack.name}: "
-            f"{old_category} → {new_category}"
+            f"{old_category} → {stack.category_display}"
         )
         print(msg)
 
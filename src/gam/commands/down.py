@@ -12,9 +12,7 @@ def cmd_down(manager: StackManager, args) -> None:
     elif args.category:
         stacks_to_stop = manager.get_category_stacks(args.category)
     elif args.tag:
-        stacks_to_stop = [
-            s for s in manager.stacks.values() if args.tag in s.tags
-        ]
+        stacks_to_stop = manager.get_tag_stacks(args.tag)
     else:
         if not args.target:
             print("Error: Provide a stack name or use --all, -c, or -t")
@@ -26,14 +24,17 @@ def cmd_down(manager: StackManager, args) -> None:
             sys.exit(1)
         stacks_to_stop = [stack]
 
-    # Stop in reverse priority order
-    stacks_to_stop.sort(key=lambda s: -s.priority)
+    # Stop in reverse priority order, dependents before dependencies
+    batches = manager.batch_stacks(
+        stacks_to_stop, by_priority=True, reverse=True
+    )
 
     print(f"Stopping {len(stacks_to_stop)} stack(s)...\n")
 
-    for stack in stacks_to_stop:
-        print(f"  Stopping {stack.name}...", end=" ")
-        if stack.down():
-            print("✓")
-        else:
-            print("✗ FAILED")
+    for batch in batches:
+        # Capture output when several stacks run at once.
+        quiet = len(batch) > 1
+        results = manager.run_batch(batch, lambda s: s.down(quiet=quiet))
+        for stack, ok in zip(batch, results):
+            manager.invalidate_status(stack)
+            print(f"  Stopping {stack.name}...", "✓" if ok else "✗ FAILED")
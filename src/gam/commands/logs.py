@@ -1,8 +1,10 @@
 import subprocess
 import sys
+import tempfile
 import threading
-from queue import Queue
+from queue import Empty, Queue
 
+from gam.stack import DOCKER_BIN
 from gam.stack_manager import StackManager
 
 
@@ -27,9 +29,7 @@ def cmd_logs(manager: StackManager, args) -> None:
             print(f"No stacks found in category '{args.category}'")
             sys.exit(1)
     elif args.tag:
-        stacks_to_show = [
-            s for s in manager.stacks.values() if args.tag in s.tags
-        ]
+        stacks_to_show = manager.get_tag_stacks(args.tag)
         if not stacks_to_show:
             print(f"No stacks found with tag '{args.tag}'")
             sys.exit(1)
@@ -42,7 +42,7 @@ def cmd_logs(manager: StackManager, args) -> None:
         sys.exit(1)
 
     # Build docker compose logs command
-    cmd = ["docker", "compose", "logs"]
+    cmd = [DOCKER_BIN, "compose", "logs"]
     if args.follow:
         cmd.append("--follow")
     if args.since:
@@ -73,19 +73,24 @@ def cmd_logs(manager: StackManager, args) -> None:
 def _show_logs_serial(stacks: list, cmd: list) -> None:
     """Show historical logs from multiple stacks serially."""
     for stack in stacks:
-        result = subprocess.run(
-            cmd,
-            cwd=stack.path,
-            capture_output=True,
-            text=True
-        )
-        # Prefix each line with stack name
-        if result.stdout:
-            for line in result.stdout.splitlines():
-                print(f"[{stack.name}] {line}")
-        # Also show stderr if present
-        if result.stderr:
-            for line in result.stderr.splitlines():
+        # Spool stderr to a file so a chatty stderr can't fill its pipe
+        # and block the child while stdout is still being read.
+        with tempfile.TemporaryFile(mode='w+') as err_file:
+            with subprocess.Popen(
+                cmd,
+                cwd=stack.path,
+                stdout=subprocess.PIPE,
+                stderr=err_file,
+                text=True
+            ) as proc:
+                # Prefix each line with stack name as it arrives
+                for line in proc.stdout:
+                    line = line.rstrip('\n')
+                    print(f"[{stack.name}] {line}")
+            # Also show stderr if present
+            err_file.seek(0)
+            for line in err_file:
+                line = line.rstrip('\n')
                 print(f"[{stack.name}] {line}", file=sys.stderr)
 
 
@@ -106,15 +111,19 @@ def _show_logs_parallel(stacks: list, cmd: list) -> None:
         thread.start()
         threads.append(thread)
 
-    # Print from queue until interrupted
+    # Print from queue until every stream ends or we're interrupted
+    remaining = len(threads)
     try:
-        while True:
-            if not output_queue.empty():
-                line = output_queue.get()
-                print(line, end='')
+        while remaining:
+            # Block for the next line; the timeout keeps Ctrl-C responsive
+            try:
+                line = output_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            if line is None:
+                remaining -= 1
             else:
-                # Small sleep to avoid busy waiting
-                threading.Event().wait(0.01)
+                print(line, end='')
     except KeyboardInterrupt:
         print("\n\nStopping log streaming...")
         shutdown_event.set()
@@ -129,7 +138,10 @@ def _stream_logs_with_prefix(
     output_queue: Queue,
     shutdown_event: threading.Event
 ) -> None:
-    """Stream logs from a stack and prefix each line."""
+    """Stream logs from a stack and prefix each line.
+
+    Puts None on the queue once the stream has ended.
+    """
     try:
         proc = subprocess.Popen(
             cmd,
@@ -156,3 +168,6 @@ def _stream_logs_with_prefix(
         output_queue.put(
             f"[{stack_name}] Error streaming logs: {e}\n"
         )
+    finally:
+        # Tell the printer this stream is done
+        output_queue.put(None)
@@ -1,3 +1,7 @@
+import sys
+from itertools import groupby
+from operator import attrgetter
+
 from gam.stack_manager import StackManager
 
 
@@ -9,29 +13,37 @@ def cmd_ls(manager: StackManager, args) -> None:
         print("No stacks found")
         return
 
-    # Group by category
-    by_category = {}
-    for stack in stacks:
-        by_category.setdefault(stack.category, []).append(stack)
+    statuses = manager.get_statuses(stacks)
+
+    # Group by category. The sort is stable, so each group keeps the
+    # priority order list_stacks returned.
+    by_category = sorted(stacks, key=attrgetter('category'))
 
-    for category, cat_stacks in sorted(by_category.items()):
-        print(f"\n{'='*60}")
-        print(f"{category.upper()}")
-        print(f"{'='*60}")
+    # Build all output first and write it once.
+    lines = []
+    for category, cat_stacks in groupby(by_category, attrgetter('category')):
+        lines.append(f"\n{'='*60}")
+        lines.append(f"{category.upper()}")
+        lines.append(f"{'='*60}")
 
         for stack in cat_stacks:
-            status = stack.get_status()
+            status = statuses[stack.name]
             status_icon = "●" if status['status'] == 'running' else "○"
 
-            print(f"\n  {status_icon} {stack.name}")
+            lines.append(f"\n  {status_icon} {stack.name}")
             if stack.description:
-                print(f"     {stack.description}")
-            print(f"     Path: {stack.path}")
+                lines.append(f"     {stack.description}")
+            lines.append(f"     Path: {stack.path}")
             tags_display = ', '.join(stack.tags) if stack.tags else 'none'
-            print(f"     Tags: {tags_display}")
+            lines.append(f"     Tags: {tags_display}")
             containers_info = (
                 f"({status['running']}/{status['containers']} containers)"
             )
-            print(f"     Status: {status['status']} {containers_info}")
+            lines.append(f"     Status: {status['status']} {containers_info}")
             if stack.auto_start:
-                print(f"     Auto-start: yes (priority {stack.priority})")
+                lines.append(
+                    f"     Auto-start: yes (priority {stack.priority})"
+                )
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
@@ -12,9 +12,7 @@ def cmd_restart(manager: StackManager, args) -> None:
     elif args.category:
         stacks_to_restart = manager.get_category_stacks(args.category)
     elif args.tag:
-        stacks_to_restart = [
-            s for s in manager.stacks.values() if args.tag in s.tags
-        ]
+        stacks_to_restart = manager.get_tag_stacks(args.tag)
     else:
         if not args.target:
             print("Error: Provide a stack name or use --all, -c, or -t")
@@ -26,14 +24,20 @@ def cmd_restart(manager: StackManager, args) -> None:
             sys.exit(1)
         stacks_to_restart = [stack]
 
-    # Restart in reverse priority order (stop), then normal (start)
-    stacks_to_restart.sort(key=lambda s: -s.priority)
+    # Restart in reverse priority order, like stopping: priority 5 first,
+    # dependents before the stacks they use
+    batches = manager.batch_stacks(
+        stacks_to_restart, by_priority=True, reverse=True
+    )
 
     print(f"Restarting {len(stacks_to_restart)} stack(s)...\n")
 
-    for stack in stacks_to_restart:
-        print(f"  Restarting {stack.name}...", end=" ")
-        if stack.restart():
-            print("✓")
-        else:
-            print("✗ FAILED")
+    for batch in batches:
+        # Capture output when several stacks run at once.
+        quiet = len(batch) > 1
+        results = manager.run_batch(
+            batch, lambda s: s.restart(hard=args.hard, quiet=quiet)
+        )
+        for stack, ok in zip(batch, results):
+            manager.invalidate_status(stack)
+            print(f"  Restarting {stack.name}...", "✓" if ok else "✗ FAILED")
@@ -1,18 +1,25 @@
+import sys
+
 from gam.stack_manager import StackManager
 
 
 def cmd_search(manager: StackManager, args) -> None:
     """Search for stacks."""
-    results = manager.search(args.term)
+    results = manager.search(*args.terms)
 
     if not results:
-        print(f"No stacks found matching '{args.term}'")
+        print(f"No stacks found matching '{' '.join(args.terms)}'")
         return
 
-    print(f"\nFound {len(results)} stack(s):\n")
+    lines = [f"\nFound {len(results)} stack(s):\n"]
 
     for stack in results:
-        print(f"  • {stack.name}")
-        print(f"    {stack.description or 'No description'}")
-        print(f"    Category: {stack.category}, Tags: {', '.join(stack.tags)}")
-        print()
+        lines.append(f"  • {stack.name}")
+        lines.append(f"    {stack.description or 'No description'}")
+        lines.append(
+            f"    Category: {stack.category}, Tags: {', '.join(stack.tags)}"
+        )
+        lines.append("")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
@@ -0,0 +1,59 @@
+import shlex
+import sys
+
+from gam.stack_manager import StackManager
+
+
+def cmd_shell(manager: StackManager, args) -> None:
+    """Run commands read from stdin, reusing one set of stacks."""
+    # Imported here since gam.cli imports this package.
+    from gam.cli import build_parser, get_command
+
+    parser = build_parser()
+    # --deep-scan finds a different set of stacks; scan for it on first use.
+    managers = {manager.deep_scan: manager}
+    interactive = sys.stdin.isatty()
+    if interactive:
+        try:
+            import readline  # noqa: F401 - enables line editing in input()
+        except ImportError:
+            pass
+
+    while True:
+        try:
+            line = input("gam> " if interactive else "")
+        except EOFError:
+            if interactive:
+                print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}")
+            continue
+        if not argv:
+            continue
+        if argv[0] in ('exit', 'quit'):
+            break
+
+        try:
+            shell_args = parser.parse_args(argv)
+            if shell_args.command == 'shell':
+                print("Already in a gam shell")
+                continue
+            deep_scan = getattr(shell_args, 'deep_scan', False)
+            if deep_scan not in managers:
+                managers[deep_scan] = StackManager(
+                    root_dir=manager.root_dir, deep_scan=deep_scan
+                )
+            command_manager = managers[deep_scan]
+            # Containers may have changed since the previous command.
+            command_manager.invalidate_statuses()
+            get_command(shell_args.command)(command_manager, shell_args)
+        except SystemExit:
+            # Usage errors and failed commands exit; keep the shell going.
+            pass
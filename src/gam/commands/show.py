@@ -10,36 +10,35 @@ def cmd_show(manager: StackManager, args) -> None:
         print(f"Stack '{args.stack}' not found")
         sys.exit(1)
 
-    status = stack.get_status()
-
-    print(f"\nStack: {stack.name}")
-    print(f"{'='*60}")
-    print(f"Description:  {stack.description or 'N/A'}")
-    if stack.subcategory:
-        category_display = f"{stack.category}/{stack.subcategory}"
-    else:
-        category_display = stack.category
-    print(f"Category:     {category_display}")
+    status = manager.get_status(stack)
+
+    lines = [f"\nStack: {stack.name}"]
+    lines.append(f"{'='*60}")
+    lines.append(f"Description:  {stack.description or 'N/A'}")
+    lines.append(f"Category:     {stack.category_display}")
     tags_display = ', '.join(stack.tags) if stack.tags else 'none'
-    print(f"Tags:         {tags_display}")
-    print(f"Path:         {stack.path}")
+    lines.append(f"Tags:         {tags_display}")
+    lines.append(f"Path:         {stack.path}")
     containers_info = (
         f"({status['running']}/{status['containers']} containers)"
     )
-    print(f"Status:       {status['status']} {containers_info}")
-    print(f"Auto-start:   {'yes' if stack.auto_start else 'no'}")
+    lines.append(f"Status:       {status['status']} {containers_info}")
+    lines.append(f"Auto-start:   {'yes' if stack.auto_start else 'no'}")
     if stack.auto_start:
-        print(f"Priority:     {stack.priority}")
-    print(f"Critical:     {'yes' if stack.critical else 'no'}")
+        lines.append(f"Priority:     {stack.priority}")
+    lines.append(f"Critical:     {'yes' if stack.critical else 'no'}")
 
     if stack.depends_on:
-        print(f"Dependencies: {', '.join(stack.depends_on)}")
+        lines.append(f"Dependencies: {', '.join(stack.depends_on)}")
 
     if stack.owner:
-        print(f"Owner:        {stack.owner}")
+        lines.append(f"Owner:        {stack.owner}")
 
     if stack.documentation:
-        print(f"Docs:         {stack.documentation}")
+        lines.append(f"Docs:         {stack.documentation}")
 
     if stack.health_check_url:
-        print(f"Health:       {stack.health_check_url}")
+        lines.append(f"Health:       {stack.health_check_url}")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
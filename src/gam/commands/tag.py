@@ -14,7 +14,7 @@ def cmd_tag(manager: StackManager, args) -> None:
         print(f"\nFound {len(tags)} unique tag(s):\n")
         for tag in tags:
             # Count how many stacks use this tag
-            count = sum(1 for s in manager.stacks.values() if tag in s.tags)
+            count = len(manager.get_tag_stacks(tag))
             print(f"  • {tag} ({count} stack{'s' if count != 1 else ''})")
 
     elif args.tag_action == 'add':
@@ -31,6 +31,7 @@ def cmd_tag(manager: StackManager, args) -> None:
 
         if added:
             stack.save_metadata()
+            manager.invalidate_indexes()
             print(f"✓ Added tag(s) to {stack.name}: {', '.join(added)}")
         else:
             print(f"All specified tags already exist on {stack.name}")
@@ -49,6 +50,7 @@ def cmd_tag(manager: StackManager, args) -> None:
 
         if removed:
             stack.save_metadata()
+            manager.invalidate_indexes()
             removed_tags = ', '.join(removed)
             print(f"✓ Removed tag(s) from {stack.name}: {removed_tags}")
         else:
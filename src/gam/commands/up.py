@@ -6,15 +6,14 @@ from gam.stack_manager import StackManager
 def cmd_up(manager: StackManager, args) -> None:
     """Start stack(s)."""
     stacks_to_start = []
+    skipped = []
 
     if args.all:
         stacks_to_start = list(manager.stacks.values())
     elif args.category:
         stacks_to_start = manager.get_category_stacks(args.category)
     elif args.tag:
-        stacks_to_start = [
-            s for s in manager.stacks.values() if args.tag in s.tags
-        ]
+        stacks_to_start = manager.get_tag_stacks(args.tag)
     else:
         if not args.target:
             print("Error: Provide a stack name or use --all, -c, or -t")
@@ -27,20 +26,36 @@ def cmd_up(manager: StackManager, args) -> None:
 
         # Include dependencies if requested
         if args.with_deps:
-            deps = manager.resolve_dependencies(stack)
-            stacks_to_start = deps + [stack]
+            try:
+                deps = manager.resolve_dependencies(stack)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            # Leave dependencies whose containers, exited ones included,
+            # are all running alone. The requested stack is always
+            # brought up.
+            statuses = manager.get_statuses(deps)
+            for dep in deps:
+                status = statuses[dep.name]
+                if 0 < status['containers'] == status['running']:
+                    skipped.append(dep)
+                else:
+                    stacks_to_start.append(dep)
+            stacks_to_start.append(stack)
         else:
             stacks_to_start = [stack]
 
-    # Sort by priority if requested
-    if args.priority:
-        stacks_to_start.sort(key=lambda s: s.priority)
+    # Start dependencies first, by priority if requested
+    batches = manager.batch_stacks(stacks_to_start, by_priority=args.priority)
 
     print(f"Starting {len(stacks_to_start)} stack(s)...\n")
-
-    for stack in stacks_to_start:
-        print(f"  Starting {stack.name}...", end=" ")
-        if stack.up():
-            print("✓")
-        else:
-            print("✗ FAILED")
+    for stack in skipped:
+        print(f"  Skipping {stack.name} (already running)")
+
+    for batch in batches:
+        # Capture output when several stacks run at once.
+        quiet = len(batch) > 1
+        results = manager.run_batch(batch, lambda s: s.up(quiet=quiet))
+        for stack, ok in zip(batch, results):
+            manager.invalidate_status(stack)
+            print(f"  Starting {stack.name}...", "✓" if ok else "✗ FAILED")
@@ -1,4 +1,4 @@
-import yaml
+import sys
 
 from gam.stack_manager import StackManager
 
@@ -8,43 +8,46 @@ def cmd_validate(manager: StackManager, args) -> None:
     print("Validating stacks...\n")
 
     if args.target:
-        stacks = (manager.get_stack(args.target),)
+        stack = manager.get_stack(args.target)
+        if not stack:
+            print(f"Stack '{args.target}' not found")
+            sys.exit(1)
+        stacks = (stack,)
     else:
         stacks = manager.stacks.values()
 
     issues = []
+    known = manager.stack_names
 
     for stack in stacks:
         # Check compose file exists
-        if not stack.compose_file.exists():
-            issues.append(f"  ✗ {stack.name}: docker-compose.yml not found")
+        if not stack.exists():
+            issues.append(f"  ✗ {stack.name}: {stack.compose_name} not found")
 
         # Check for name field mismatch in metadata
-        if stack.meta_file.exists():
-            try:
-                with open(stack.meta_file) as f:
-                    meta = yaml.safe_load(f) or {}
-                    if 'name' in meta and meta['name'] != stack.name:
-                        issues.append(
-                            f"  ⚠ {stack.name}: metadata contains 'name' field "
-                            f"('{meta['name']}') - name is derived from path and "
-                            f"cannot be overridden"
-                        )
-            except FileNotFoundError:
-                # File doesn't actually exist (can happen with mocking in tests).
-                pass
+        has_metadata = stack.has_metadata()
+        if has_metadata:
+            # Served from the metadata cache unless the file changed.
+            meta = stack.read_metadata()
+            if 'name' in meta and meta['name'] != stack.name:
+                issues.append(
+                    f"  ⚠ {stack.name}: metadata contains 'name' field "
+                    f"('{meta['name']}') - name is derived from path and "
+                    f"cannot be overridden"
+                )
 
         # Check dependencies exist
         for dep in stack.depends_on:
-            if not manager.get_stack(dep):
+            if dep not in known:
                 issues.append(f"  ✗ {stack.name}: dependency '{dep}' not found")
 
         # Warn about missing metadata
-        if not stack.meta_file.exists():
+        if not has_metadata:
             issues.append(f"  ⚠ {stack.name}: no .stack-meta.yaml file")
 
     if issues:
+        # Write the report at once rather than a print per issue.
+        issues.append(f"\n{len(issues)} issue(s) found")
         print("\n".join(issues))
-        print(f"\n{len(issues)} issue(s) found")
     else:
         print("✓ All stacks valid")
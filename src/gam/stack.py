@@ -1,10 +1,45 @@
+import json
+import os
+import shutil
 import subprocess
+import sys
+import zlib
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import yaml
+# orjson is optional; its errors subclass ValueError like json's do.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-@dataclass
+# Resolve the docker binary once instead of searching PATH per call.
+DOCKER_BIN = shutil.which("docker") or "docker"
+
+
+# Fields .stack-meta.yaml may set. The name and path always come from the
+# stack's directory.
+METADATA_FIELDS = frozenset({
+    'category', 'subcategory', 'tags', 'description', 'auto_start',
+    'priority', 'depends_on', 'expected_containers', 'critical', 'owner',
+    'documentation', 'health_check_url',
+})
+
+def cache_dir() -> Path:
+    """Return gam's cache directory, under $XDG_CACHE_HOME."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return Path(cache_home, 'gam')
+
+
+# Compose file names docker compose looks for, in its order of preference.
+COMPOSE_FILE_NAMES = (
+    'compose.yaml', 'compose.yml', 'docker-compose.yaml', 'docker-compose.yml',
+)
+
+
+@dataclass(slots=True)
 class Stack:
     """Represents a Docker Compose stack with metadata."""
     name: str
@@ -21,32 +56,138 @@ class Stack:
     owner: str = ""
     documentation: str = ""
     health_check_url: str = ""
+    compose_name: str = field(default="docker-compose.yml", repr=False,
+                              compare=False)
+    # File presence seen during discovery; None means not yet checked.
+    compose_found: bool | None = field(default=None, repr=False,
+                                       compare=False)
+    meta_found: bool | None = field(default=None, repr=False, compare=False)
+    _loaded: bool = field(default=False, init=False, repr=False,
+                          compare=False)
+    _search_text: str | None = field(default=None, init=False, repr=False,
+                                     compare=False)
 
     @property
     def compose_file(self) -> Path:
-        return self.path / "docker-compose.yml"
+        return self.path / self.compose_name
 
     @property
     def meta_file(self) -> Path:
         return self.path / ".stack-meta.yaml"
 
+    @property
+    def meta_cache_file(self) -> Path:
+        # Kept out of the stack directory so reads never write to it.
+        key = f'{zlib.crc32(str(self.meta_file.absolute()).encode()):08x}'
+        return cache_dir() / 'meta' / f'{key}.json'
+
+    @property
+    def category_display(self) -> str:
+        """Category, with the subcategory appended if set."""
+        if self.subcategory:
+            return f"{self.category}/{self.subcategory}"
+        return self.category
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased name, description and tags, NUL-separated."""
+        if self._search_text is None:
+            fields = [self.name, self.description, *self.tags]
+            self._search_text = '\x00'.join(fields).lower()
+        return self._search_text
+
     def exists(self) -> bool:
-        return self.compose_file.exists()
+        if self.compose_found is None:
+            self.compose_found = self.compose_file.exists()
+        return self.compose_found
+
+    def has_metadata(self) -> bool:
+        """Check whether the stack has a .stack-meta.yaml file."""
+        if self.meta_found is None:
+            self.meta_found = self.meta_file.exists()
+        return self.meta_found
+
+    def ensure_loaded(self) -> None:
+        """Load metadata if it hasn't been loaded yet."""
+        if not self._loaded:
+            self.load_metadata()
 
     def load_metadata(self) -> None:
         """Load metadata from .stack-meta.yaml."""
-        if self.meta_file.exists():
-            with open(self.meta_file) as f:
-                meta = yaml.safe_load(f) or {}
-                for key, value in meta.items():
-                    # Skip 'name' - it's always derived from path.
-                    if key == 'name':
-                        continue
-                    if hasattr(self, key):
-                        setattr(self, key, value)
-
-    def save_metadata(self) -> None:
-        """Save metadata to .stack-meta.yaml."""
+        self._loaded = True
+        self._search_text = None
+        if self.meta_found is False:
+            # Discovery already saw there is no metadata file.
+            return
+
+        # Unknown keys, including 'name', are ignored.
+        meta = self.read_metadata()
+        for key in METADATA_FIELDS.intersection(meta):
+            setattr(self, key, meta[key])
+
+    def read_metadata(self) -> dict:
+        """Return every key in .stack-meta.yaml, or {} if it's missing.
+
+        The parsed file is cached as JSON in gam's cache directory (see
+        cache_dir()), keyed by the file's path, mtime and size, so YAML
+        is only parsed again after the file changes.
+        """
+        try:
+            meta_stat = self.meta_file.stat()
+        except FileNotFoundError:
+            return {}
+
+        meta = self._read_meta_cache(meta_stat)
+        if meta is None:
+            meta = _parse_yaml(self.meta_file.read_bytes())
+            self._write_meta_cache(meta_stat, meta)
+        return meta
+
+    def _read_meta_cache(self, meta_stat: os.stat_result) -> dict | None:
+        """Return cached metadata if it matches the YAML file's stat."""
+        try:
+            cache = json_loads(self.meta_cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        # Collisions are harmless: the cache records the file it's for.
+        if (cache.get('path') != str(self.meta_file.absolute()) or
+                cache.get('mtime_ns') != meta_stat.st_mtime_ns or
+                cache.get('size') != meta_stat.st_size):
+            return None
+        return cache.get('meta')
+
+    def _write_meta_cache(
+        self, meta_stat: os.stat_result, meta: dict
+    ) -> None:
+        """Write parsed metadata to the JSON cache, ignoring failures."""
+        cache = {
+            'path': str(self.meta_file.absolute()),
+            'mtime_ns': meta_stat.st_mtime_ns,
+            'size': meta_stat.st_size,
+            'meta': meta,
+        }
+        cache_file = self.meta_cache_file
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            # Unwritable cache directory or values JSON can't represent (e.g.
+            # YAML dates) - fall back to parsing YAML every time.
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def save_metadata(self) -> bool:
+        """Save metadata to .stack-meta.yaml.
+
+        Returns False if the file already held the same metadata and was
+        left untouched, True if it was written.
+        """
+        self._search_text = None
         # Build metadata dict from current values.
         # Note: 'name' is omitted - it's always derived from directory path.
         meta = {
@@ -73,61 +214,119 @@ class Stack:
         if self.health_check_url:
             meta['health_check_url'] = self.health_check_url
 
-        # Write to file
-        with open(self.meta_file, 'w') as f:
-            yaml.dump(meta, f, default_flow_style=False,
-                      sort_keys=False, indent=2)
+        import yaml
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        text = yaml.dump(meta, Dumper=dumper, default_flow_style=False,
+                         sort_keys=False, indent=2)
 
-    def get_status(self) -> dict:
-        """Get running status using docker compose ps."""
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "ps", "--format", "json"],
-                cwd=self.path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if result.stdout.strip():
-                containers = [
-                    yaml.safe_load(line)
-                    for line in result.stdout.strip().split('\n')
-                ]
-                running = sum(
-                    1 for c in containers if c.get('State') == 'running'
+        # Skip unchanged files so bulk renames only touch affected stacks
+        # and their metadata caches stay valid.
+        if self.meta_found is not False:
+            try:
+                if self.meta_file.read_text() == text:
+                    self.meta_found = True
+                    return False
+            except (OSError, UnicodeDecodeError):
+                pass
+        self.meta_file.write_text(text)
+        self.meta_found = True
+        return True
+
+    def get_status(self, containers: list[dict] | None = None) -> dict:
+        """Get running status using docker compose ps.
+
+        Stopped and exited containers count towards the total, so a stack
+        is only fully up when every container is running. If containers
+        (dicts with a 'State' key) are given, they are summarized instead
+        of querying docker.
+        """
+        if containers is None:
+            try:
+                result = subprocess.run(
+                    [DOCKER_BIN, "compose", "ps", "--all", "--format", "json"],
+                    cwd=self.path,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                containers = (
+                    _parse_ps_output(result.stdout)
+                    if result.stdout.strip() else []
                 )
-                return {
-                    'status': 'running' if running > 0 else 'stopped',
-                    'containers': len(containers),
-                    'running': running
-                }
-        except subprocess.CalledProcessError:
-            pass
-        return {'status': 'stopped', 'containers': 0, 'running': 0}
-
-    def up(self, detached: bool = True) -> bool:
+            except subprocess.CalledProcessError:
+                containers = []
+
+        running = sum(1 for c in containers if c.get('State') == 'running')
+        return {
+            'status': 'running' if running > 0 else 'stopped',
+            'containers': len(containers),
+            'running': running
+        }
+
+    def up(self, detached: bool = True, quiet: bool = False) -> bool:
         """Start the stack."""
-        cmd = ["docker", "compose", "up"]
         if detached:
-            cmd.append("-d")
-        try:
-            subprocess.run(cmd, cwd=self.path, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            return self._compose("up", "-d", quiet=quiet)
+        return self._compose("up", quiet=quiet)
 
-    def down(self) -> bool:
+    def down(self, quiet: bool = False) -> bool:
         """Stop the stack."""
+        return self._compose("down", quiet=quiet)
+
+    def restart(self, hard: bool = False, quiet: bool = False) -> bool:
+        """Restart the stack's containers.
+
+        With hard=True, the stack is taken down and brought back up
+        instead, recreating containers from the current compose file.
+        """
+        if hard:
+            return self.down(quiet=quiet) and self.up(quiet=quiet)
+        return self._compose("restart", quiet=quiet)
+
+    def _compose(self, *args: str, quiet: bool = False) -> bool:
+        """Run a docker compose command in the stack directory.
+
+        With quiet, output is captured so concurrent runs don't interleave
+        on the terminal, and only written to stderr if the command fails.
+        """
         try:
             subprocess.run(
-                ["docker", "compose", "down"],
+                [DOCKER_BIN, "compose", *args],
                 cwd=self.path,
+                capture_output=quiet,
+                text=quiet,
                 check=True
             )
             return True
-        except subprocess.CalledProcessError:
+        except subprocess.CalledProcessError as e:
+            if quiet and e.stderr:
+                sys.stderr.write(e.stderr)
             return False
 
-    def restart(self) -> bool:
-        """Restart the stack."""
-        return self.down() and self.up()
+
+def _parse_yaml(data: bytes) -> dict:
+    """Parse YAML metadata, preferring the libyaml-based loader.
+
+    PyYAML is imported here rather than at module level, since a fresh
+    JSON cache means most runs never need it.
+    """
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(data, Loader=loader) or {}
+
+
+def _parse_ps_output(output: str) -> list[dict]:
+    """Parse docker compose ps JSON output into a list of containers.
+
+    Newer Compose releases emit a single JSON array; older ones emit one
+    JSON object per line.
+    """
+    try:
+        containers = json_loads(output)
+    except ValueError:
+        return [
+            json_loads(line) for line in output.splitlines() if line.strip()
+        ]
+    if isinstance(containers, dict):
+        return [containers]
+    return containers
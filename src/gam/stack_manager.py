@@ -1,33 +1,118 @@
+import json
 import os
+import subprocess
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, KeysView
+from operator import attrgetter
 from pathlib import Path
 
-from gam.stack import Stack
+from gam.stack import COMPOSE_FILE_NAMES, DOCKER_BIN, Stack, cache_dir
+
+# Maximum number of concurrent docker compose status queries.
+MAX_STATUS_WORKERS = 16
+
+# Maximum number of stacks started or stopped at the same time.
+MAX_LIFECYCLE_WORKERS = 8
+
+# Maximum number of threads loading stack metadata.
+MAX_LOAD_WORKERS = 8
+
+# Default stack ordering: priority, then category, then name.
+STACK_SORT_KEY = attrgetter('priority', 'category', 'name')
+
+# Label Compose sets to the directory a container's project runs from.
+WORKING_DIR_LABEL = "com.docker.compose.project.working_dir"
+
+# Directories modified this recently aren't trusted to the discovery
+# index, since coarse filesystem timestamps could hide a later change.
+INDEX_RACY_NS = 2_000_000_000
+
 
 class StackManager:
     """Manages all Docker Compose stacks."""
 
-    def __init__(self, root_dir: Path = Path.cwd()):
+    def __init__(self, root_dir: Path = Path.cwd(), deep_scan: bool = False):
         self.root_dir = root_dir
-        self.stacks: dict[str, Stack] = {}
+        self.deep_scan = deep_scan
+        self._stacks: dict[str, Stack] = {}
+        self._all_loaded = False
+        self._status_cache: dict[str, dict] = {}
+        self._dependency_cache: dict[str, list[str]] = {}
+        self._by_category: dict[str, list[Stack]] | None = None
+        self._by_tag: dict[str, list[Stack]] | None = None
+        self._autostart: list[Stack] | None = None
         self.discover_stacks()
 
     def discover_stacks(self) -> None:
-        """Find all docker-compose.yml files and load metadata."""
-        for compose_file in self.root_dir.rglob("docker-compose.yml"):
-            stack_path = compose_file.parent
-            # Skip if in hidden directory
-            if any(part.startswith('.') for part in stack_path.parts):
-                continue
-
+        """Find all compose files and create stacks for them."""
+        self._dependency_cache.clear()
+        self._all_loaded = False
+        self.invalidate_indexes()
+        found = _discover_stack_dirs(str(self.root_dir), self.deep_scan)
+        for stack_dir, compose_name, has_meta in found:
             # Derive stack name from path
-            rel_path = stack_path.relative_to(self.root_dir)
-            stack_name = str(rel_path).replace(os.sep, '-')
+            rel_path = os.path.relpath(stack_dir, self.root_dir)
+            stack_name = rel_path.replace(os.sep, '-')
 
-            # Create and load stack
-            stack = Stack(name=stack_name, path=stack_path)
-            stack.load_metadata()
+            # Metadata is loaded lazily, on first use of the stack.
+            self._stacks[stack_name] = Stack(
+                name=stack_name,
+                path=Path(stack_dir),
+                compose_name=compose_name,
+                compose_found=True,
+                meta_found=has_meta,
+            )
 
-            self.stacks[stack_name] = stack
+    @property
+    def stacks(self) -> dict[str, Stack]:
+        """All discovered stacks, with metadata loaded."""
+        if not self._all_loaded:
+            stacks = list(self._stacks.values())
+            workers = min(MAX_LOAD_WORKERS, os.cpu_count() or 1, len(stacks))
+            if workers > 1:
+                # File reads release the GIL, so threads overlap the I/O.
+                with _thread_pool(workers) as executor:
+                    list(executor.map(lambda s: s.ensure_loaded(), stacks))
+            else:
+                for stack in stacks:
+                    stack.ensure_loaded()
+            self._all_loaded = True
+        return self._stacks
+
+    @stacks.setter
+    def stacks(self, stacks: dict[str, Stack]) -> None:
+        self._stacks = stacks
+        self._all_loaded = False
+        self.invalidate_indexes()
+
+    @property
+    def stack_names(self) -> KeysView[str]:
+        """Names of all discovered stacks, without loading metadata."""
+        return self._stacks.keys()
+
+    def invalidate_indexes(self) -> None:
+        """Drop the category, tag and autostart indexes after edits."""
+        self._by_category = None
+        self._by_tag = None
+        self._autostart = None
+
+    def _build_indexes(self) -> None:
+        """Group stacks by category and by tag, in discovery order."""
+        by_category: dict[str, list[Stack]] = {}
+        by_tag: dict[str, list[Stack]] = {}
+        autostart: list[Stack] = []
+        for stack in self.stacks.values():
+            by_category.setdefault(stack.category, []).append(stack)
+            for tag in dict.fromkeys(stack.tags):
+                by_tag.setdefault(tag, []).append(stack)
+            if stack.auto_start:
+                autostart.append(stack)
+        autostart.sort(key=attrgetter('priority'))
+        self._by_category = by_category
+        self._by_tag = by_tag
+        self._autostart = autostart
 
     def list_stacks(
         self,
@@ -35,57 +120,250 @@ class StackManager:
         tag: str | None = None
     ) -> list[Stack]:
         """List stacks with optional filtering."""
-        stacks = list(self.stacks.values())
-
         if category:
-            stacks = [s for s in stacks if s.category == category]
-
-        if tag:
-            stacks = [s for s in stacks if tag in s.tags]
+            stacks = self.get_category_stacks(category)
+            if tag:
+                stacks = [s for s in stacks if tag in s.tags]
+        elif tag:
+            stacks = self.get_tag_stacks(tag)
+        else:
+            stacks = list(self.stacks.values())
 
-        return sorted(stacks, key=lambda s: (s.priority, s.category, s.name))
+        return sorted(stacks, key=STACK_SORT_KEY)
 
     def get_stack(self, name: str) -> Stack | None:
-        """Get stack by name."""
-        return self.stacks.get(name)
+        """Get stack by name, loading only its metadata."""
+        stack = self._stacks.get(name)
+        if stack:
+            stack.ensure_loaded()
+        return stack
+
+    def get_status(self, stack: Stack) -> dict:
+        """Get stack status, reusing an earlier result from this run."""
+        status = self._status_cache.get(stack.name)
+        if status is None:
+            status = stack.get_status()
+            self._status_cache[stack.name] = status
+        return status
+
+    def get_statuses(self, stacks: list[Stack]) -> dict[str, dict]:
+        """Get status for multiple stacks, keyed by name.
+
+        Uses a single docker ps call for all stacks, falling back to
+        concurrent per-stack queries if that fails.
+        """
+        missing = [s for s in stacks if s.name not in self._status_cache]
+        by_dir = self._list_containers() if len(missing) > 1 else None
+        if by_dir is not None:
+            for stack in missing:
+                containers = by_dir.get(os.path.realpath(stack.path), [])
+                self._status_cache[stack.name] = stack.get_status(containers)
+        elif len(missing) == 1:
+            stack = missing[0]
+            self._status_cache[stack.name] = stack.get_status()
+        elif missing:
+            workers = min(MAX_STATUS_WORKERS, len(missing))
+            with _thread_pool(workers) as executor:
+                statuses = executor.map(lambda s: s.get_status(), missing)
+                for stack, status in zip(missing, statuses):
+                    self._status_cache[stack.name] = status
+        return {s.name: self._status_cache[s.name] for s in stacks}
+
+    def _list_containers(self) -> dict[str, list[dict]] | None:
+        """List Compose containers, stopped ones too, by project directory.
+
+        Returns None if docker ps can't be run.
+        """
+        fmt = f'{{{{.Label "{WORKING_DIR_LABEL}"}}}}\t{{{{.State}}}}'
+        try:
+            proc = subprocess.Popen(
+                [DOCKER_BIN, "ps", "--all",
+                 "--filter", f"label={WORKING_DIR_LABEL}", "--format", fmt],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError:
+            return None
+
+        # Group lines as docker writes them, resolving each directory once.
+        by_dir: dict[str, list[dict]] = {}
+        resolved: dict[str, list[dict]] = {}
+        with proc:
+            for line in proc.stdout:
+                working_dir, _, state = line.rstrip('\n').rpartition('\t')
+                if not working_dir:
+                    continue
+                containers = resolved.get(working_dir)
+                if containers is None:
+                    real_dir = os.path.realpath(working_dir)
+                    containers = by_dir.setdefault(real_dir, [])
+                    resolved[working_dir] = containers
+                containers.append({'State': state})
+        if proc.returncode:
+            return None
+        return by_dir
+
+    def invalidate_status(self, stack: Stack) -> None:
+        """Forget the cached status of a stack after it changes state."""
+        self._status_cache.pop(stack.name, None)
+
+    def invalidate_statuses(self) -> None:
+        """Forget all cached statuses."""
+        self._status_cache.clear()
 
     def get_category_stacks(self, category: str) -> list[Stack]:
         """Get all stacks in a category."""
-        return [s for s in self.stacks.values() if s.category == category]
+        if self._by_category is None:
+            self._build_indexes()
+        return list(self._by_category.get(category, ()))
 
-    def search(self, term: str) -> list[Stack]:
-        """Search stacks by name, description, and tags."""
-        term_lower = term.lower()
-        results = []
-        for stack in self.stacks.values():
-            if (term_lower in stack.name.lower() or
-                term_lower in stack.description.lower() or
-                any(term_lower in tag.lower() for tag in stack.tags)):
-                results.append(stack)
-        return results
+    def get_tag_stacks(self, tag: str) -> list[Stack]:
+        """Get all stacks with a tag."""
+        if self._by_tag is None:
+            self._build_indexes()
+        return list(self._by_tag.get(tag, ()))
+
+    def search(self, *terms: str) -> list[Stack]:
+        """Search stacks by name, description, and tags.
+
+        A stack matches if it contains every term.
+        """
+        terms_lower = [term.lower() for term in terms]
+        return [
+            s for s in self.stacks.values()
+            if all(term in s.search_text for term in terms_lower)
+        ]
 
     def get_autostart_stacks(self) -> list[Stack]:
         """Get stacks with auto_start=true, sorted by priority."""
-        stacks = [s for s in self.stacks.values() if s.auto_start]
-        return sorted(stacks, key=lambda s: s.priority)
+        if self._autostart is None:
+            self._build_indexes()
+        return self._autostart[:]
+
+    def dependency_levels(self, stacks: list[Stack]) -> list[list[Stack]]:
+        """Group stacks into levels that can start concurrently.
+
+        Each level depends only on stacks in earlier levels. Dependencies
+        outside the given stacks are ignored, and stacks caught in a
+        dependency cycle are appended one per level, in input order.
+        """
+        position = {s.name: i for i, s in enumerate(stacks)}
+        in_degree = {}
+        dependents = {s.name: [] for s in stacks}
+        for stack in stacks:
+            deps = [d for d in dict.fromkeys(stack.depends_on) if d in position]
+            in_degree[stack.name] = len(deps)
+            for dep_name in deps:
+                dependents[dep_name].append(stack.name)
+
+        levels = []
+        level = [s for s in stacks if not in_degree[s.name]]
+        while level:
+            levels.append(level)
+            next_names = []
+            for stack in level:
+                for dependent in dependents[stack.name]:
+                    in_degree[dependent] -= 1
+                    if not in_degree[dependent]:
+                        next_names.append(dependent)
+            next_names.sort(key=position.__getitem__)
+            level = [stacks[position[name]] for name in next_names]
+
+        levels.extend([s] for s in stacks if in_degree[s.name])
+        return levels
+
+    def batch_stacks(
+        self,
+        stacks: list[Stack],
+        by_priority: bool = False,
+        reverse: bool = False
+    ) -> list[list[Stack]]:
+        """Split stacks into batches to run one after another.
+
+        Stacks within a batch can run concurrently. With by_priority, each
+        priority (1 first) gets its own batches. Use reverse for stopping.
+        """
+        if by_priority:
+            groups: dict[int, list[Stack]] = {}
+            for stack in stacks:
+                groups.setdefault(stack.priority, []).append(stack)
+            ordered = [groups[priority] for priority in sorted(groups)]
+        else:
+            ordered = [stacks]
+
+        batches = [
+            level for group in ordered
+            for level in self.dependency_levels(group)
+        ]
+        if reverse:
+            batches.reverse()
+        return batches
+
+    def run_batch(
+        self, stacks: list[Stack], action: Callable[[Stack], bool]
+    ) -> list[bool]:
+        """Run action on stacks concurrently, returning results in order."""
+        if len(stacks) <= 1:
+            return [action(stack) for stack in stacks]
+        workers = min(MAX_LIFECYCLE_WORKERS, len(stacks))
+        with _thread_pool(workers) as executor:
+            return list(executor.map(action, stacks))
 
     def resolve_dependencies(self, stack: Stack) -> list[Stack]:
-        """Get dependency chain for a stack."""
-        deps = []
-        for dep_name in stack.depends_on:
-            dep_stack = self.get_stack(dep_name)
-            if dep_stack:
-                # Recursively get dependencies
-                deps.extend(self.resolve_dependencies(dep_stack))
-                deps.append(dep_stack)
-        return deps
+        """Get dependency chain for a stack in start order.
+
+        Results are cached by stack name until the next discovery. Raises
+        ValueError if the dependencies form a cycle.
+        """
+        cached = self._dependency_cache.get(stack.name)
+        if cached is not None:
+            return [self._stacks[name] for name in cached]
+
+        # Collect every stack reachable from the target (breadth-first).
+        reachable = {stack.name: stack}
+        queue = deque([stack])
+        while queue:
+            for dep_name in queue.popleft().depends_on:
+                dep_stack = self.get_stack(dep_name)
+                if dep_stack and dep_name not in reachable:
+                    reachable[dep_name] = dep_stack
+                    queue.append(dep_stack)
+
+        # Kahn's algorithm over the reachable subgraph.
+        in_degree = {}
+        dependents = {name: [] for name in reachable}
+        for name, node in reachable.items():
+            deps = dict.fromkeys(d for d in node.depends_on if d in reachable)
+            in_degree[name] = len(deps)
+            for dep_name in deps:
+                dependents[dep_name].append(name)
+
+        ready = deque(name for name in reachable if not in_degree[name])
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    ready.append(dependent)
+
+        if len(order) != len(reachable):
+            cycle = sorted(name for name in reachable if in_degree[name])
+            raise ValueError(
+                f"Dependency cycle detected among: {', '.join(cycle)}"
+            )
+
+        order.remove(stack.name)
+        self._dependency_cache[stack.name] = order
+        return [reachable[name] for name in order]
 
     def get_all_tags(self) -> list[str]:
         """Get all unique tags across all stacks."""
-        tags = set()
-        for stack in self.stacks.values():
-            tags.update(stack.tags)
-        return sorted(tags)
+        if self._by_tag is None:
+            self._build_indexes()
+        return sorted(self._by_tag)
 
     def get_all_categories(self) -> list[tuple]:
         """Get all unique categories (category, subcategory) tuples."""
@@ -95,26 +373,171 @@ class StackManager:
         return sorted(categories)
 
     def rename_tag(self, old_tag: str, new_tag: str) -> int:
-        """Rename a tag across all stacks. Returns count of affected stacks."""
+        """Rename a tag across all stacks.
+
+        Returns the number of stacks whose metadata file was rewritten.
+        """
+        if old_tag == new_tag:
+            return 0
         count = 0
-        for stack in self.stacks.values():
-            if old_tag in stack.tags:
+        for stack in self.get_tag_stacks(old_tag):
+            # Rename in place so the tag keeps its position in the file
+            if new_tag in stack.tags:
                 stack.tags.remove(old_tag)
-                if new_tag not in stack.tags:
-                    stack.tags.append(new_tag)
-                stack.save_metadata()
+            else:
+                stack.tags[stack.tags.index(old_tag)] = new_tag
+            if stack.save_metadata():
                 count += 1
+        if count:
+            self.invalidate_indexes()
         return count
 
     def rename_category(self, old_category: str, new_category: str) -> int:
         """Rename a category across all stacks.
 
-        Returns count of affected stacks.
+        Returns the number of stacks whose metadata file was rewritten.
         """
+        if old_category == new_category:
+            return 0
         count = 0
-        for stack in self.stacks.values():
-            if stack.category == old_category:
-                stack.category = new_category
-                stack.save_metadata()
+        for stack in self.get_category_stacks(old_category):
+            stack.category = new_category
+            if stack.save_metadata():
                 count += 1
+        if count:
+            self.invalidate_indexes()
         return count
+
+
+def _thread_pool(workers: int):
+    """Create a thread pool executor.
+
+    concurrent.futures is imported here because it pulls in logging,
+    which commands that never need a pool shouldn't pay for at startup.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def _discover_stack_dirs(
+    root: str, deep: bool = False
+) -> list[tuple[str, str, bool]]:
+    """Find stack directories, reusing the discovery index if valid.
+
+    The index lives in the user's cache directory and is skipped when
+    GAM_NO_CACHE is set.
+    """
+    if os.environ.get('GAM_NO_CACHE'):
+        return _find_stack_dirs(root, deep=deep)
+
+    # Relative roots are keyed by where they resolve to.
+    key = os.path.abspath(root)
+    index_file = _index_file(key, deep)
+    found = _read_index(index_file, key)
+    if found is None:
+        dir_mtimes: dict[str, int] = {}
+        found = _find_stack_dirs(root, dir_mtimes, deep)
+        _write_index(index_file, key, dir_mtimes, found)
+    return found
+
+
+def _index_file(root: str, deep: bool = False) -> Path:
+    """Return the discovery index path for a stacks root."""
+    # Collisions are harmless: the index records its root and is ignored
+    # if that doesn't match.
+    key = f'{zlib.crc32(root.encode()):08x}'
+    suffix = '-deep' if deep else ''
+    return cache_dir() / f'{key}{suffix}.json'
+
+
+def _read_index(
+    index_file: Path, root: str
+) -> list[tuple[str, str, bool]] | None:
+    """Return indexed stack directories if no searched directory changed."""
+    try:
+        with open(index_file) as f:
+            index = json.load(f)
+        if index['root'] != root:
+            return None
+        for path, mtime_ns in index['dirs'].items():
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return None
+        # Indexes from older versions have no compose name and fail here.
+        return [
+            (path, compose_name, has_meta)
+            for path, compose_name, has_meta in index['stacks']
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_index(
+    index_file: Path,
+    root: str,
+    dir_mtimes: dict[str, int],
+    found: list[tuple[str, str, bool]],
+) -> None:
+    """Write the discovery index, ignoring failures."""
+    racy_after = time.time_ns() - INDEX_RACY_NS
+    if any(mtime_ns >= racy_after for mtime_ns in dir_mtimes.values()):
+        return
+    index = {'root': root, 'dirs': dir_mtimes, 'stacks': found}
+    tmp_file = index_file.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_file, index_file)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
+def _find_stack_dirs(
+    root: str,
+    dir_mtimes: dict[str, int] | None = None,
+    deep: bool = False,
+) -> list[tuple[str, str, bool]]:
+    """Find directories below root that contain a compose file.
+
+    Returns (directory, compose file name, has .stack-meta.yaml) tuples,
+    naming the compose file docker compose would pick. Hidden directories
+    are pruned without being read, and directories inside a stack are not
+    searched unless deep is set. If dir_mtimes is given, it is filled
+    with the mtime of every directory read, taken before reading it.
+    """
+    found = []
+    pending = [root]
+    while pending:
+        path = pending.pop()
+        subdirs = []
+        compose_names = set()
+        has_meta = False
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in COMPOSE_FILE_NAMES:
+                        if entry.is_file():
+                            compose_names.add(entry.name)
+                    elif entry.name == ".stack-meta.yaml":
+                        has_meta = entry.is_file()
+                    elif (not entry.name.startswith('.') and
+                          entry.is_dir(follow_symlinks=False)):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+
+        if compose_names:
+            compose_name = next(
+                n for n in COMPOSE_FILE_NAMES if n in compose_names
+            )
+            found.append((path, compose_name, has_meta))
+            # The root may hold a compose file alongside other stacks.
+            if path != root and not deep:
+                continue
+        pending.extend(subdirs)
+    return sorted(found)
@@ -0,0 +1,20 @@
+"""Pytest fixtures shared by the unit and integration tests."""
+
+import re
+
+import pytest
+
+
+def _assert_order(output: str, *names: str) -> None:
+    """Assert each name first appears in output in the given order."""
+    seen = []
+    for match in re.finditer("|".join(map(re.escape, names)), output):
+        if match.group() not in seen:
+            seen.append(match.group())
+    assert seen == list(names)
+
+
+@pytest.fixture
+def assert_order():
+    """Provide a check that names appear in command output in order."""
+    return _assert_order
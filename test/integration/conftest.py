@@ -2,10 +2,12 @@
 
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from gam.stack import Stack
 from gam.stack_manager import StackManager
 
 
@@ -15,42 +17,27 @@ def test_stacks_dir():
     return Path(__file__).parent.parent / "stacks"
 
 
-@pytest.fixture(scope="session")
-def original_metadata(test_stacks_dir):
-    """Save original metadata before tests and restore after."""
-    # Save original metadata
-    metadata_backups = {}
-    for meta_file in test_stacks_dir.rglob(".stack-meta.yaml"):
-        backup_path = meta_file.parent / ".stack-meta.yaml.backup"
-        shutil.copy2(meta_file, backup_path)
-        metadata_backups[meta_file] = backup_path
-
-    yield metadata_backups
-
-    # Restore original metadata
-    for original, backup in metadata_backups.items():
-        if backup.exists():
-            shutil.copy2(backup, original)
-            backup.unlink()
-
-
 @pytest.fixture(autouse=True, scope="session")
-def cleanup_docker(original_metadata):
+def cleanup_docker(test_stacks_dir):
     """Clean up all test stacks before and after test session."""
-    test_dir = Path(__file__).parent.parent / "stacks"
+    stack_dirs = [
+        stack_dir for stack_dir in test_stacks_dir.iterdir()
+        if (stack_dir / "docker-compose.yml").is_file()
+    ]
+
+    def down(stack_dir):
+        """Stop and remove one stack's containers and volumes."""
+        subprocess.run(
+            ["docker", "compose", "down", "-v", "--remove-orphans"],
+            cwd=stack_dir,
+            capture_output=True,
+        )
 
     def cleanup_all():
         """Stop and remove all containers from test stacks."""
-        for stack_dir in test_dir.iterdir():
-            if stack_dir.is_dir() and (
-                stack_dir / "docker-compose.yml"
-            ).exists():
-                # Change to stack directory and run docker compose down
-                subprocess.run(
-                    ["docker", "compose", "down", "-v", "--remove-orphans"],
-                    cwd=stack_dir,
-                    capture_output=True,
-                )
+        # The stacks are independent, so tear them down concurrently.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(down, stack_dirs))
 
     # Cleanup before tests
     cleanup_all()
@@ -61,41 +48,43 @@ def cleanup_docker(original_metadata):
     cleanup_all()
 
 
-@pytest.fixture
-def manager(test_stacks_dir):
-    """Create a StackManager for the test stacks directory."""
-    manager = StackManager(root_dir=test_stacks_dir)
+@pytest.fixture(scope="session")
+def readonly_stacks(test_stacks_dir, tmp_path_factory):
+    """Share one copy of the test stacks between tests that only read.
 
-    yield manager
+    Tests using this must not edit metadata, change stacks or start
+    containers; those need clean_stacks.
+    """
+    root = tmp_path_factory.mktemp("readonly")
+    stacks_dir = root / "stacks"
+    shutil.copytree(test_stacks_dir, stacks_dir)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(root / "cache"))
+        yield StackManager(root_dir=stacks_dir)
 
 
 @pytest.fixture
-def clean_stacks(test_stacks_dir):
-    """Ensure all stacks are stopped and metadata restored each test."""
-    manager = StackManager(root_dir=test_stacks_dir)
-
-    # Stop all stacks
-    for stack in manager.stacks.values():
-        stack.down()
-
-    # Save metadata before test
-    metadata_backups = {}
-    for meta_file in test_stacks_dir.rglob(".stack-meta.yaml"):
-        if ".backup" not in str(meta_file) and ".testbackup" not in str(
-            meta_file
-        ):
-            backup_path = meta_file.parent / ".stack-meta.yaml.testbackup"
-            shutil.copy2(meta_file, backup_path)
-            metadata_backups[meta_file] = backup_path
+def clean_stacks(test_stacks_dir, tmp_path, monkeypatch):
+    """Give each test its own copy of the test stacks.
 
-    yield manager
+    Metadata edits and caches land in the copy. Containers outlive it,
+    so stacks the test started are stopped afterwards; every stack
+    begins the session stopped.
+    """
+    stacks_dir = tmp_path / "stacks"
+    shutil.copytree(test_stacks_dir, stacks_dir)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    started = {}
+    stack_up = Stack.up
 
-    # Stop all stacks after test
-    for stack in manager.stacks.values():
-        stack.down()
+    def tracking_up(stack, *args, **kwargs):
+        started[stack.path] = stack
+        return stack_up(stack, *args, **kwargs)
+
+    monkeypatch.setattr(Stack, "up", tracking_up)
+
+    manager = StackManager(root_dir=stacks_dir)
+    yield manager
 
-    # Restore metadata after test
-    for original, backup in metadata_backups.items():
-        if backup.exists():
-            shutil.copy2(backup, original)
-            backup.unlink()
+    manager.run_batch(list(started.values()), lambda s: s.down(quiet=True))
@@ -22,7 +22,7 @@ def test_autostart_starts_configured_stacks(clean_stacks, capsys):
             stack.down()
 
 
-def test_autostart_priority_order(clean_stacks, capsys):
+def test_autostart_priority_order(clean_stacks, capsys, assert_order):
     """Test autostart respects priority order."""
 
     # Temporarily set another stack to auto-start with different priority
@@ -39,9 +39,7 @@ def test_autostart_priority_order(clean_stacks, capsys):
         captured = capsys.readouterr()
         # stack-b (priority 1) should start before stack-a (priority 2)
         output = captured.out
-        stack_b_pos = output.find("[1]")
-        stack_a_pos = output.find("[2]")
-        assert stack_b_pos < stack_a_pos
+        assert_order(output, "[1]", "[2]")
     finally:
         # Restore original values
         stack_a.auto_start = original_auto_start
@@ -110,7 +110,7 @@ def test_down_by_tag(clean_stacks, capsys):
         stack.down()
 
 
-def test_down_reverse_priority(clean_stacks, capsys):
+def test_down_reverse_priority(clean_stacks, capsys, assert_order):
     """Test down command uses reverse priority order."""
 
     # Start all stacks
@@ -134,6 +134,4 @@ def test_down_reverse_priority(clean_stacks, capsys):
     captured = capsys.readouterr()
     # stack-d (priority 5) should stop before stack-b (priority 1)
     output = captured.out
-    stack_d_pos = output.find("stack-d")
-    stack_b_pos = output.find("stack-b")
-    assert stack_d_pos < stack_b_pos
+    assert_order(output, "stack-d", "stack-b")
@@ -24,7 +24,8 @@ def test_restart_single_stack(clean_stacks, capsys):
         target="hello",
         all=False,
         category=None,
-        tag=None
+        tag=None,
+        hard=False
     )
 
     try:
@@ -52,7 +53,9 @@ def test_restart_all_stacks(clean_stacks, capsys):
     cmd_up(clean_stacks, up_args)
 
     # Restart all
-    restart_args = Namespace(target=None, all=True, category=None, tag=None)
+    restart_args = Namespace(
+        target=None, all=True, category=None, tag=None, hard=False
+    )
 
     try:
         cmd_restart(clean_stacks, restart_args)
@@ -83,7 +86,8 @@ def test_restart_by_category(clean_stacks, capsys):
         target=None,
         all=False,
         category="test",
-        tag=None
+        tag=None,
+        hard=False
     )
 
     try:
@@ -116,7 +120,8 @@ def test_restart_by_tag(clean_stacks, capsys):
         target=None,
         all=False,
         category=None,
-        tag="dev"
+        tag="dev",
+        hard=False
     )
 
     try:
@@ -1,148 +1,58 @@
 """Integration tests for up command."""
 
 from argparse import Namespace
-import time
 
-from gam.commands.up import cmd_up
-
-
-def test_up_single_stack(clean_stacks, capsys):
-    """Test up command starts a single stack."""
-    args = Namespace(
-        target="hello",
-        all=False,
-        category=None,
-        tag=None,
-        priority=False,
-        with_deps=False
-    )
-
-    try:
-        cmd_up(clean_stacks, args)
-
-        captured = capsys.readouterr()
-        assert "Starting 1 stack(s)" in captured.out
-        assert "hello" in captured.out
-    finally:
-        # Cleanup
-        clean_stacks.get_stack("hello").down()
-
-
-def test_up_all_stacks(clean_stacks, capsys):
-    """Test up command starts all stacks."""
-    args = Namespace(
-        target=None,
-        all=True,
-        category=None,
-        tag=None,
-        priority=False,
-        with_deps=False
-    )
-
-    try:
-        cmd_up(clean_stacks, args)
-
-        captured = capsys.readouterr()
-        assert "Starting 5 stack(s)" in captured.out
-    finally:
-        # Cleanup
-        for stack in clean_stacks.stacks.values():
-            stack.down()
-
-
-def test_up_by_category(clean_stacks, capsys):
-    """Test up command starts stacks by category."""
-    args = Namespace(
-        target=None,
-        all=False,
-        category="test",
-        tag=None,
-        priority=False,
-        with_deps=False
-    )
+import pytest
 
-    try:
-        cmd_up(clean_stacks, args)
-
-        captured = capsys.readouterr()
-        # Should start hello, stack-a, stack-c (all in test category)
-        assert "Starting 3 stack(s)" in captured.out
-    finally:
-        # Cleanup
-        for stack in clean_stacks.stacks.values():
-            stack.down()
+from gam.commands.up import cmd_up
 
 
-def test_up_by_tag(clean_stacks, capsys):
-    """Test up command starts stacks by tag."""
+def _up_args(**kwargs):
+    """Build up command arguments, starting from no selection."""
     args = Namespace(
         target=None,
         all=False,
         category=None,
-        tag="dev",
+        tag=None,
         priority=False,
         with_deps=False
     )
-
-    try:
-        cmd_up(clean_stacks, args)
-
-        captured = capsys.readouterr()
-        # Should start hello and stack-a (both have dev tag)
-        assert "Starting 2 stack(s)" in captured.out
-    finally:
-        # Cleanup
-        for stack in clean_stacks.stacks.values():
-            stack.down()
-
-
-def test_up_with_priority(clean_stacks, capsys):
+    for name, value in kwargs.items():
+        setattr(args, name, value)
+    return args
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        ({'target': "hello"}, ["Starting 1 stack(s)", "hello"]),
+        ({'all': True}, ["Starting 5 stack(s)"]),
+        # hello, stack-a and stack-c are in the test category
+        ({'category': "test"}, ["Starting 3 stack(s)"]),
+        # hello and stack-a have the dev tag
+        ({'tag': "dev"}, ["Starting 2 stack(s)"]),
+        # stack-c depends on stack-a
+        (
+            {'target': "stack-c", 'with_deps': True},
+            ["Starting 2 stack(s)", "stack-a", "stack-c"],
+        ),
+    ],
+    ids=["single", "all", "category", "tag", "with-deps"],
+)
+def test_up_selects_stacks(clean_stacks, capsys, kwargs, expected):
+    """Test up command starts the selected stacks."""
+    cmd_up(clean_stacks, _up_args(**kwargs))
+
+    captured = capsys.readouterr()
+    for text in expected:
+        assert text in captured.out
+
+
+def test_up_with_priority(clean_stacks, capsys, assert_order):
     """Test up command respects priority ordering."""
-    args = Namespace(
-        target=None,
-        all=True,
-        category=None,
-        tag=None,
-        priority=True,
-        with_deps=False
-    )
-
-    try:
-        cmd_up(clean_stacks, args)
-
-        captured = capsys.readouterr()
-        # stack-b has priority 1, should start before others
-        output = captured.out
-        stack_b_pos = output.find("stack-b")
-        stack_d_pos = output.find("stack-d")
-        # stack-b (priority 1) should appear before stack-d (priority 5)
-        assert stack_b_pos < stack_d_pos
-    finally:
-        # Cleanup
-        for stack in clean_stacks.stacks.values():
-            stack.down()
-
-
-def test_up_with_dependencies(clean_stacks, capsys):
-    """Test up command starts dependencies."""
-    args = Namespace(
-        target="stack-c",
-        all=False,
-        category=None,
-        tag=None,
-        priority=False,
-        with_deps=True
-    )
-
-    try:
-        cmd_up(clean_stacks, args)
+    cmd_up(clean_stacks, _up_args(all=True, priority=True))
 
-        captured = capsys.readouterr()
-        # Should start stack-a (dependency) and stack-c
-        assert "Starting 2 stack(s)" in captured.out
-        assert "stack-a" in captured.out
-        assert "stack-c" in captured.out
-    finally:
-        # Cleanup
-        for stack in clean_stacks.stacks.values():
-            stack.down()
+    captured = capsys.readouterr()
+    # stack-b has priority 1, should start before others
+    output = captured.out
+    assert_order(output, "stack-b", "stack-d")
@@ -1,7 +1,7 @@
 """Pytest configuration and fixtures for gam tests."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -9,10 +9,27 @@ from gam.stack import Stack
 from gam.stack_manager import StackManager
 
 
+class MockableStack(Stack):
+    """Stack that allows replacing methods on individual instances.
+
+    Stack uses __slots__, so tests that swap in MagicMock methods need a
+    subclass with an instance __dict__.
+    """
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep discovery indexes out of the user's cache directory."""
+    cache_home = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("GAM_NO_CACHE", raising=False)
+    return cache_home
+
+
 @pytest.fixture
 def mock_stack():
     """Create a mock stack for testing."""
-    stack = Stack(
+    stack = MockableStack(
         name="test-stack",
         path=Path("/fake/path/test-stack"),
         category="test",
@@ -27,7 +44,7 @@ def mock_stack():
 @pytest.fixture
 def mock_stack_autostart():
     """Create a mock stack with auto-start enabled."""
-    stack = Stack(
+    stack = MockableStack(
         name="autostart-stack",
         path=Path("/fake/path/autostart-stack"),
         category="production",
@@ -42,7 +59,7 @@ def mock_stack_autostart():
 @pytest.fixture
 def mock_stack_with_deps():
     """Create a mock stack with dependencies."""
-    stack = Stack(
+    stack = MockableStack(
         name="dependent-stack",
         path=Path("/fake/path/dependent-stack"),
         category="app",
@@ -59,22 +76,26 @@ def mock_manager(mock_stack, mock_stack_autostart, mock_stack_with_deps):
     """Create a mock StackManager with test stacks."""
     manager = StackManager.__new__(StackManager)
     manager.root_dir = Path("/fake/path")
+    manager.deep_scan = False
     manager.stacks = {
         "test-stack": mock_stack,
         "autostart-stack": mock_stack_autostart,
         "dependent-stack": mock_stack_with_deps,
     }
+    manager._status_cache = {}
+    manager._dependency_cache = {}
     return manager
 
 
 @pytest.fixture
 def mock_args():
-    """Create a mock args object."""
-    args = MagicMock()
-    args.category = None
-    args.tag = None
-    args.all = False
-    args.priority = False
-    args.with_deps = False
-    args.target = None
-    return args
+    """Create an args object with the common command options unset."""
+    return SimpleNamespace(
+        category=None,
+        tag=None,
+        all=False,
+        priority=False,
+        with_deps=False,
+        hard=False,
+        target=None,
+    )
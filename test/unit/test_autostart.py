@@ -31,7 +31,9 @@ class TestAutostartCommand:
         assert "✓" in captured.out
         stacks[0].up.assert_called_once()
 
-    def test_autostart_priority_order(self, mock_manager, mock_args, capsys):
+    def test_autostart_priority_order(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
         """Test autostart respects priority order."""
         # Create additional auto-start stack with different priority
         stack2 = MagicMock()
@@ -53,7 +55,7 @@ class TestAutostartCommand:
 
         captured = capsys.readouterr()
         # Priority 1 should appear before priority 2
-        assert captured.out.index("[1]") < captured.out.index("[2]")
+        assert_order(captured.out, "[1]", "[2]")
 
     def test_autostart_failure(self, mock_manager, mock_args, capsys):
         """Test autostart handles failures."""
@@ -65,3 +67,21 @@ class TestAutostartCommand:
 
         captured = capsys.readouterr()
         assert "✗ FAILED" in captured.out
+
+    def test_autostart_dependencies_first(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
+        """Test dependencies start before dependents of equal priority."""
+        stacks = [
+            mock_manager.stacks["dependent-stack"],
+            mock_manager.stacks["test-stack"],
+        ]
+        for stack in stacks:
+            stack.priority = 1
+            stack.up = MagicMock(return_value=True)
+        mock_manager.get_autostart_stacks = MagicMock(return_value=stacks)
+
+        cmd_autostart(mock_manager, mock_args)
+
+        captured = capsys.readouterr()
+        assert_order(captured.out, "test-stack", "dependent-stack")
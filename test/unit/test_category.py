@@ -64,31 +64,19 @@ class TestCategoryCommand:
         assert "production" in captured.out
         assert "development" in captured.out
 
-    def test_category_set(self, mock_manager, mock_args, capsys):
-        """Test setting category for a stack."""
-        mock_args.category_action = 'set'
-        mock_args.stack = 'test-stack'
-        mock_args.new_category = 'production'
-        mock_args.subcategory = None
-        stack = mock_manager.stacks['test-stack']
-        stack.save_metadata = MagicMock()
-
-        cmd_category(mock_manager, mock_args)
-
-        captured = capsys.readouterr()
-        assert "Changed category for test-stack" in captured.out
-        assert "test → production" in captured.out
-        assert stack.category == 'production'
-        stack.save_metadata.assert_called_once()
-
-    def test_category_set_with_subcategory(
-        self, mock_manager, mock_args, capsys
+    @pytest.mark.parametrize(
+        "subcategory,expected",
+        [(None, "services"), ("backend", "services/backend")],
+        ids=["category", "subcategory"],
+    )
+    def test_category_set(
+        self, mock_manager, mock_args, capsys, subcategory, expected
     ):
-        """Test setting category with subcategory."""
+        """Test setting category, and optionally subcategory, for a stack."""
         mock_args.category_action = 'set'
         mock_args.stack = 'test-stack'
         mock_args.new_category = 'services'
-        mock_args.subcategory = 'backend'
+        mock_args.subcategory = subcategory
         stack = mock_manager.stacks['test-stack']
         stack.save_metadata = MagicMock()
 
@@ -96,7 +84,9 @@ class TestCategoryCommand:
 
         captured = capsys.readouterr()
         assert "Changed category for test-stack" in captured.out
-        assert "services/backend" in captured.out
+        assert f"test → {expected}" in captured.out
+        assert stack.category_display == expected
+        stack.save_metadata.assert_called_once()
 
     def test_category_set_stack_not_found(self, mock_manager, mock_args):
         """Test setting category for non-existent stack."""
@@ -41,43 +41,53 @@ class TestDownCommand:
         captured = capsys.readouterr()
         assert "Stopping 3 stack(s)" in captured.out
 
-    def test_down_by_category(self, mock_manager, mock_args, capsys):
-        """Test stopping stacks by category."""
-        mock_args.category = "test"
-        mock_manager.get_category_stacks = MagicMock(
-            return_value=[mock_manager.stacks["test-stack"]]
-        )
-        mock_manager.stacks["test-stack"].down = MagicMock(
-            return_value=True
-        )
+    @pytest.mark.parametrize(
+        "filter_attr,filter_value,stack_name",
+        [
+            ("category", "test", "test-stack"),
+            ("tag", "backend", "dependent-stack"),
+        ],
+        ids=["category", "tag"],
+    )
+    def test_down_by_filter(
+        self, mock_manager, mock_args, capsys,
+        filter_attr, filter_value, stack_name
+    ):
+        """Test stopping stacks by category or tag."""
+        setattr(mock_args, filter_attr, filter_value)
+        stack = mock_manager.stacks[stack_name]
+        stack.down = MagicMock(return_value=True)
 
         cmd_down(mock_manager, mock_args)
 
         captured = capsys.readouterr()
         assert "Stopping 1 stack(s)" in captured.out
+        stack.down.assert_called_once()
 
-    def test_down_by_tag(self, mock_manager, mock_args, capsys):
-        """Test stopping stacks by tag."""
-        mock_args.tag = "backend"
-        mock_manager.stacks["dependent-stack"].down = MagicMock(
-            return_value=True
-        )
+    def test_down_reverse_priority(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
+        """Test stopping in reverse priority order."""
+        mock_args.all = True
+        for stack in mock_manager.stacks.values():
+            stack.down = MagicMock(return_value=True)
 
         cmd_down(mock_manager, mock_args)
 
         captured = capsys.readouterr()
-        assert "Stopping 1 stack(s)" in captured.out
+        # Priority 3 should stop before priority 1
+        assert_order(captured.out, "test-stack", "autostart-stack")
 
-    def test_down_reverse_priority(self, mock_manager, mock_args, capsys):
-        """Test stopping in reverse priority order."""
+    def test_down_dependents_first(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
+        """Test dependents stop before their dependencies."""
         mock_args.all = True
+        mock_manager.stacks["dependent-stack"].priority = 3
         for stack in mock_manager.stacks.values():
             stack.down = MagicMock(return_value=True)
 
         cmd_down(mock_manager, mock_args)
 
         captured = capsys.readouterr()
-        # Priority 3 should stop before priority 1
-        assert captured.out.index("test-stack") < captured.out.index(
-            "autostart-stack"
-        )
+        assert_order(captured.out, "dependent-stack", "test-stack")
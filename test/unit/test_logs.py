@@ -1,56 +1,85 @@
 """Tests for logs command."""
 
-from unittest.mock import MagicMock, call, patch
+import io
+import sys
+import threading
+from subprocess import Popen
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
-from gam.commands.logs import cmd_logs
+from gam.commands.logs import _show_logs_serial, cmd_logs
+from gam.stack import DOCKER_BIN
+
+
+@pytest.fixture
+def logs_args(mock_args):
+    """Create logs command args with no stacks selected and no options."""
+    mock_args.stacks = []
+    mock_args.follow = False
+    mock_args.since = None
+    mock_args.tail = None
+    mock_args.timestamps = False
+    mock_args.until = None
+    return mock_args
+
+
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch):
+    """Replace subprocess.run for single-stack logs."""
+    run = MagicMock()
+    monkeypatch.setattr('gam.commands.logs.subprocess.run', run)
+    return run
+
+
+def _popen(stdout="", stderr=""):
+    """Build a Popen side effect whose processes stream the given output."""
+    def start(*args, **kwargs):
+        err = kwargs.get('stderr')
+        if hasattr(err, 'write'):
+            # Serial logs spool stderr to a file passed in by the caller
+            err.write(stderr)
+        proc = MagicMock(stdout=io.StringIO(stdout))
+        proc.__enter__.return_value = proc
+        return proc
+    return start
+
+
+@pytest.fixture(autouse=True)
+def mock_popen(monkeypatch):
+    """Replace subprocess.Popen for the logs command with empty streams."""
+    popen = MagicMock(side_effect=_popen())
+    monkeypatch.setattr('gam.commands.logs.subprocess.Popen', popen)
+    return popen
 
 
 class TestLogsCommand:
     """Test cases for the logs command."""
 
-    def test_logs_single_stack(self, mock_manager, mock_args, capsys):
+    def test_logs_single_stack(
+        self, mock_manager, logs_args, mock_run, capsys
+    ):
         """Test showing logs for a single stack."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            mock_run.assert_called_once()
-            assert mock_run.call_args[0][0] == [
-                "docker", "compose", "logs"
-            ]
+        logs_args.stacks = ["test-stack"]
+
+        cmd_logs(mock_manager, logs_args)
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            DOCKER_BIN, "compose", "logs"
+        ]
 
         captured = capsys.readouterr()
         assert "Showing logs for test-stack" in captured.out
 
     def test_logs_multiple_stacks_by_name(
-        self, mock_manager, mock_args, capsys
+        self, mock_manager, logs_args, mock_popen, capsys
     ):
         """Test showing logs for multiple named stacks."""
-        mock_args.stacks = ["test-stack", "autostart-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="log line 1\nlog line 2\n", stderr=""
-            )
-            cmd_logs(mock_manager, mock_args)
+        logs_args.stacks = ["test-stack", "autostart-stack"]
+
+        mock_popen.side_effect = _popen("log line 1\nlog line 2\n")
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "Showing logs from 2 stack(s)" in captured.out
@@ -59,253 +88,158 @@ class TestLogsCommand:
         assert "[autostart-stack]" in captured.out
 
     def test_logs_all_stacks_explicit(
-        self, mock_manager, mock_args, capsys
+        self, mock_manager, logs_args, capsys
     ):
         """Test showing logs from all stacks with --all flag."""
-        mock_args.stacks = []
-        mock_args.all = True
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="")
-            cmd_logs(mock_manager, mock_args)
+        logs_args.all = True
+
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "Showing logs from 3 stack(s)" in captured.out
 
-    def test_logs_no_args_shows_all(self, mock_manager, mock_args, capsys):
+    def test_logs_no_args_shows_all(self, mock_manager, logs_args, capsys):
         """Test that logs with no args defaults to showing all stacks."""
-        mock_args.stacks = []
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="")
-            cmd_logs(mock_manager, mock_args)
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "Showing logs from 3 stack(s)" in captured.out
 
-    def test_logs_by_category(self, mock_manager, mock_args, capsys):
+    def test_logs_by_category(self, mock_manager, logs_args, capsys):
         """Test showing logs filtered by category."""
-        mock_args.stacks = []
-        mock_args.all = False
-        mock_args.category = "production"
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
+        logs_args.category = "production"
 
         mock_manager.get_category_stacks = MagicMock(
             return_value=[mock_manager.stacks["autostart-stack"]]
         )
 
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="")
-            cmd_logs(mock_manager, mock_args)
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "Showing logs for autostart-stack" in captured.out
 
-    def test_logs_by_tag(self, mock_manager, mock_args, capsys):
+    def test_logs_by_tag(self, mock_manager, logs_args, capsys):
         """Test showing logs filtered by tag."""
-        mock_args.stacks = []
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = "dev"
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="")
-            cmd_logs(mock_manager, mock_args)
+        logs_args.tag = "dev"
+
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "Showing logs for test-stack" in captured.out
 
-    def test_logs_nonexistent_stack(self, mock_manager, mock_args):
+    def test_logs_nonexistent_stack(self, mock_manager, logs_args):
         """Test logs with non-existent stack."""
-        mock_args.stacks = ["nonexistent"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
+        logs_args.stacks = ["nonexistent"]
 
         with pytest.raises(SystemExit):
-            cmd_logs(mock_manager, mock_args)
-
-    def test_logs_with_follow_flag(self, mock_manager, mock_args):
-        """Test logs with --follow flag."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = True
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--follow" in called_cmd
-
-    def test_logs_with_since_flag(self, mock_manager, mock_args):
-        """Test logs with --since flag."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = "2024-01-01"
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--since" in called_cmd
-            assert "2024-01-01" in called_cmd
-
-    def test_logs_with_tail_flag(self, mock_manager, mock_args):
-        """Test logs with -n/--tail flag."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = "100"
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--tail" in called_cmd
-            assert "100" in called_cmd
-
-    def test_logs_with_timestamps_flag(self, mock_manager, mock_args):
-        """Test logs with -T/--timestamps flag."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = True
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--timestamps" in called_cmd
-
-    def test_logs_with_until_flag(self, mock_manager, mock_args):
-        """Test logs with --until flag."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = "2024-12-31"
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--until" in called_cmd
-            assert "2024-12-31" in called_cmd
+            cmd_logs(mock_manager, logs_args)
+
+    @pytest.mark.parametrize(
+        "attr,value,expected",
+        [
+            ("follow", True, ["--follow"]),
+            ("since", "2024-01-01", ["--since", "2024-01-01"]),
+            ("tail", "100", ["--tail", "100"]),
+            ("timestamps", True, ["--timestamps"]),
+            ("until", "2024-12-31", ["--until", "2024-12-31"]),
+        ],
+        ids=["follow", "since", "tail", "timestamps", "until"],
+    )
+    def test_logs_with_flag(
+        self, mock_manager, logs_args, mock_run, attr, value, expected
+    ):
+        """Test each logs option is passed on to docker compose logs."""
+        logs_args.stacks = ["test-stack"]
+        setattr(logs_args, attr, value)
+
+        cmd_logs(mock_manager, logs_args)
+        called_cmd = mock_run.call_args[0][0]
+        assert called_cmd == [DOCKER_BIN, "compose", "logs", *expected]
 
     def test_logs_prefixing_multiple_stacks(
-        self, mock_manager, mock_args, capsys
+        self, mock_manager, logs_args, mock_popen, capsys
     ):
         """Test that log lines are prefixed with stack names."""
-        mock_args.stacks = ["test-stack", "autostart-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = False
-        mock_args.since = None
-        mock_args.tail = None
-        mock_args.timestamps = False
-        mock_args.until = None
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="test log line\n", stderr=""
-            )
-            cmd_logs(mock_manager, mock_args)
+        logs_args.stacks = ["test-stack", "autostart-stack"]
+
+        mock_popen.side_effect = _popen("test log line\n", "warning\n")
+        cmd_logs(mock_manager, logs_args)
 
         captured = capsys.readouterr()
         assert "[test-stack] test log line" in captured.out
         assert "[autostart-stack] test log line" in captured.out
+        assert "[test-stack] warning" in captured.err
 
-    def test_logs_empty_category(self, mock_manager, mock_args):
+    def test_logs_empty_category(self, mock_manager, logs_args):
         """Test logs with category that has no stacks."""
-        mock_args.stacks = []
-        mock_args.all = False
-        mock_args.category = "nonexistent"
-        mock_args.tag = None
-        mock_args.follow = False
+        logs_args.category = "nonexistent"
 
         mock_manager.get_category_stacks = MagicMock(return_value=[])
 
         with pytest.raises(SystemExit):
-            cmd_logs(mock_manager, mock_args)
+            cmd_logs(mock_manager, logs_args)
 
-    def test_logs_empty_tag(self, mock_manager, mock_args):
+    def test_logs_empty_tag(self, mock_manager, logs_args):
         """Test logs with tag that matches no stacks."""
-        mock_args.stacks = []
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = "nonexistent"
-        mock_args.follow = False
+        logs_args.tag = "nonexistent"
 
         with pytest.raises(SystemExit):
-            cmd_logs(mock_manager, mock_args)
+            cmd_logs(mock_manager, logs_args)
 
-    def test_logs_with_all_flags(self, mock_manager, mock_args):
+    def test_logs_with_all_flags(self, mock_manager, logs_args, mock_run):
         """Test logs with all flags combined."""
-        mock_args.stacks = ["test-stack"]
-        mock_args.all = False
-        mock_args.category = None
-        mock_args.tag = None
-        mock_args.follow = True
-        mock_args.since = "2024-01-01"
-        mock_args.tail = "50"
-        mock_args.timestamps = True
-        mock_args.until = "2024-12-31"
-
-        with patch('gam.commands.logs.subprocess.run') as mock_run:
-            cmd_logs(mock_manager, mock_args)
-            called_cmd = mock_run.call_args[0][0]
-            assert "--follow" in called_cmd
-            assert "--since" in called_cmd
-            assert "2024-01-01" in called_cmd
-            assert "--tail" in called_cmd
-            assert "50" in called_cmd
-            assert "--timestamps" in called_cmd
-            assert "--until" in called_cmd
-            assert "2024-12-31" in called_cmd
+        logs_args.stacks = ["test-stack"]
+        logs_args.follow = True
+        logs_args.since = "2024-01-01"
+        logs_args.tail = "50"
+        logs_args.timestamps = True
+        logs_args.until = "2024-12-31"
+
+        cmd_logs(mock_manager, logs_args)
+        called_cmd = mock_run.call_args[0][0]
+        assert called_cmd == [
+            DOCKER_BIN, "compose", "logs",
+            "--follow",
+            "--since", "2024-01-01",
+            "--tail", "50",
+            "--timestamps",
+            "--until", "2024-12-31",
+        ]
+
+    def test_logs_follow_multiple_stacks_ends_with_streams(
+        self, mock_manager, logs_args, mock_popen, capsys
+    ):
+        """Test following several stacks returns once all streams end."""
+        logs_args.stacks = ["test-stack", "autostart-stack"]
+        logs_args.follow = True
+
+        mock_popen.side_effect = _popen("streamed line\n")
+        cmd_logs(mock_manager, logs_args)
+
+        captured = capsys.readouterr()
+        assert "[test-stack] streamed line" in captured.out
+        assert "[autostart-stack] streamed line" in captured.out
+
+    def test_logs_serial_large_stderr(self, tmp_path, monkeypatch, capsys):
+        """Test a stderr larger than a pipe buffer doesn't block output."""
+        # Popen was imported before mock_popen replaced it
+        monkeypatch.setattr('gam.commands.logs.subprocess.Popen', Popen)
+        # About 200 KB of stderr, then a line on stdout
+        script = (
+            "import sys; sys.stderr.write(('e' * 99 + '\\n') * 2000); "
+            "print('done')"
+        )
+        stack = SimpleNamespace(name="big", path=tmp_path)
+
+        thread = threading.Thread(
+            target=_show_logs_serial,
+            args=([stack], [sys.executable, "-c", script]),
+            daemon=True
+        )
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        captured = capsys.readouterr()
+        assert "[big] done" in captured.out
+        assert captured.err.count("[big] eee") == 2000
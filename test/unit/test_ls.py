@@ -1,8 +1,6 @@
 """Tests for ls (list) command."""
 
-from unittest.mock import MagicMock, patch
-
-import pytest
+from unittest.mock import MagicMock
 
 from gam.commands.ls import cmd_ls
 
@@ -25,15 +23,11 @@ class TestLsCommand:
         stacks = list(mock_manager.stacks.values())
         mock_manager.list_stacks = MagicMock(return_value=stacks)
 
-        # Mock get_status for each stack
-        for stack in stacks:
-            stack.get_status = MagicMock(
-                return_value={
-                    'status': 'running',
-                    'containers': 2,
-                    'running': 2
-                }
-            )
+        # One status map for every stack, without running docker ps
+        running = {'status': 'running', 'containers': 2, 'running': 2}
+        mock_manager.get_statuses = MagicMock(
+            return_value={stack.name: running for stack in stacks}
+        )
 
         cmd_ls(mock_manager, mock_args)
 
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from gam.commands.restart import cmd_restart
 
 
@@ -21,6 +23,17 @@ class TestRestartCommand:
         assert "✓" in captured.out
         stack.restart.assert_called_once()
 
+    def test_restart_hard(self, mock_manager, mock_args, capsys):
+        """Test --hard is passed through to the stack."""
+        mock_args.target = "test-stack"
+        mock_args.hard = True
+        stack = mock_manager.stacks["test-stack"]
+        stack.restart = MagicMock(return_value=True)
+
+        cmd_restart(mock_manager, mock_args)
+
+        stack.restart.assert_called_once_with(hard=True, quiet=False)
+
     def test_restart_all_stacks(self, mock_manager, mock_args, capsys):
         """Test restarting all stacks."""
         mock_args.all = True
@@ -32,32 +45,44 @@ class TestRestartCommand:
         captured = capsys.readouterr()
         assert "Restarting 3 stack(s)" in captured.out
 
-    def test_restart_by_category(self, mock_manager, mock_args, capsys):
-        """Test restarting stacks by category."""
-        mock_args.category = "app"
-        mock_manager.get_category_stacks = MagicMock(
-            return_value=[mock_manager.stacks["dependent-stack"]]
-        )
-        mock_manager.stacks["dependent-stack"].restart = MagicMock(
-            return_value=True
-        )
+    def test_restart_reverse_priority(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
+        """Test restarting goes from the highest priority number down."""
+        mock_args.all = True
+        for stack in mock_manager.stacks.values():
+            stack.restart = MagicMock(return_value=True)
 
         cmd_restart(mock_manager, mock_args)
 
         captured = capsys.readouterr()
-        assert "Restarting 1 stack(s)" in captured.out
-
-    def test_restart_by_tag(self, mock_manager, mock_args, capsys):
-        """Test restarting stacks by tag."""
-        mock_args.tag = "testing"
-        mock_manager.stacks["test-stack"].restart = MagicMock(
-            return_value=True
+        # Priorities 3, 2 and 1
+        assert_order(
+            captured.out, "test-stack", "dependent-stack", "autostart-stack"
         )
 
+    @pytest.mark.parametrize(
+        "filter_attr,filter_value,stack_name",
+        [
+            ("category", "app", "dependent-stack"),
+            ("tag", "testing", "test-stack"),
+        ],
+        ids=["category", "tag"],
+    )
+    def test_restart_by_filter(
+        self, mock_manager, mock_args, capsys,
+        filter_attr, filter_value, stack_name
+    ):
+        """Test restarting stacks by category or tag."""
+        setattr(mock_args, filter_attr, filter_value)
+        stack = mock_manager.stacks[stack_name]
+        stack.restart = MagicMock(return_value=True)
+
         cmd_restart(mock_manager, mock_args)
 
         captured = capsys.readouterr()
         assert "Restarting 1 stack(s)" in captured.out
+        stack.restart.assert_called_once()
 
     def test_restart_failure(self, mock_manager, mock_args, capsys):
         """Test restart when stack fails."""
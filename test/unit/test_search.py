@@ -10,7 +10,7 @@ class TestSearchCommand:
 
     def test_search_finds_stacks(self, mock_manager, mock_args, capsys):
         """Test searching for stacks."""
-        mock_args.term = "test"
+        mock_args.terms = ["test"]
         mock_manager.search = MagicMock(
             return_value=[mock_manager.stacks["test-stack"]]
         )
@@ -24,7 +24,7 @@ class TestSearchCommand:
 
     def test_search_no_results(self, mock_manager, mock_args, capsys):
         """Test search with no results."""
-        mock_args.term = "nonexistent"
+        mock_args.terms = ["nonexistent"]
         mock_manager.search = MagicMock(return_value=[])
 
         cmd_search(mock_manager, mock_args)
@@ -34,7 +34,7 @@ class TestSearchCommand:
 
     def test_search_multiple_results(self, mock_manager, mock_args, capsys):
         """Test search with multiple results."""
-        mock_args.term = "stack"
+        mock_args.terms = ["stack"]
         mock_manager.search = MagicMock(
             return_value=list(mock_manager.stacks.values())
         )
@@ -46,3 +46,14 @@ class TestSearchCommand:
         assert "test-stack" in captured.out
         assert "autostart-stack" in captured.out
         assert "dependent-stack" in captured.out
+
+    def test_search_multiple_terms(self, mock_manager, mock_args, capsys):
+        """Test all terms are passed on and shown when nothing matches."""
+        mock_args.terms = ["web", "prod"]
+        mock_manager.search = MagicMock(return_value=[])
+
+        cmd_search(mock_manager, mock_args)
+
+        mock_manager.search.assert_called_once_with("web", "prod")
+        captured = capsys.readouterr()
+        assert "No stacks found matching 'web prod'" in captured.out
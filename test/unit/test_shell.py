@@ -0,0 +1,83 @@
+"""Tests for shell command."""
+
+import io
+
+from gam.commands.shell import cmd_shell
+from gam.stack_manager import StackManager
+
+
+class TestShellCommand:
+    """Test cases for the shell command."""
+
+    def _run(self, mock_manager, mock_args, monkeypatch, text):
+        """Run the shell with text as stdin."""
+        monkeypatch.setattr('sys.stdin', io.StringIO(text))
+        cmd_shell(mock_manager, mock_args)
+
+    def test_shell_runs_commands(
+        self, mock_manager, mock_args, monkeypatch, capsys
+    ):
+        """Test each line is run as a gam command."""
+        self._run(
+            mock_manager, mock_args, monkeypatch,
+            "search auto-start\nsearch backend\n"
+        )
+
+        captured = capsys.readouterr()
+        assert "autostart-stack" in captured.out
+        assert "dependent-stack" in captured.out
+
+    def test_shell_survives_errors(
+        self, mock_manager, mock_args, monkeypatch, capsys
+    ):
+        """Test failing and invalid commands don't end the shell."""
+        self._run(
+            mock_manager, mock_args, monkeypatch,
+            "show missing\nbogus\n'unterminated\n\nsearch backend\n"
+        )
+
+        captured = capsys.readouterr()
+        assert "Stack 'missing' not found" in captured.out
+        assert "invalid choice" in captured.err
+        assert "Error: No closing quotation" in captured.out
+        assert "dependent-stack" in captured.out
+
+    def test_shell_quit(self, mock_manager, mock_args, monkeypatch, capsys):
+        """Test quit stops reading commands."""
+        self._run(
+            mock_manager, mock_args, monkeypatch, "quit\nsearch backend\n"
+        )
+
+        captured = capsys.readouterr()
+        assert "dependent-stack" not in captured.out
+
+    def test_shell_clears_statuses(
+        self, mock_manager, mock_args, monkeypatch
+    ):
+        """Test statuses are queried again for each command."""
+        mock_manager._status_cache["test-stack"] = {'status': 'running'}
+
+        self._run(mock_manager, mock_args, monkeypatch, "search backend\n")
+
+        assert mock_manager._status_cache == {}
+
+    def test_shell_deep_scan(self, mock_args, monkeypatch, tmp_path, capsys):
+        """Test --deep-scan finds nested stacks inside the shell."""
+        nested = tmp_path / "outer" / "inner"
+        nested.mkdir(parents=True)
+        (tmp_path / "outer" / "docker-compose.yml").write_text("")
+        (nested / "docker-compose.yml").write_text("")
+        monkeypatch.setattr(
+            StackManager, 'get_statuses',
+            lambda self, stacks: {
+                s.name: {'status': 'stopped', 'containers': 0, 'running': 0}
+                for s in stacks
+            }
+        )
+        manager = StackManager(root_dir=tmp_path)
+
+        self._run(manager, mock_args, monkeypatch, "ls\n")
+        assert "inner" not in capsys.readouterr().out
+
+        self._run(manager, mock_args, monkeypatch, "ls --deep-scan\n")
+        assert "inner" in capsys.readouterr().out
@@ -0,0 +1,279 @@
+"""Tests for Stack model."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from gam.stack import Stack
+
+
+class TestStackMetadata:
+    """Test cases for loading stack metadata."""
+
+    def test_load_metadata_writes_cache(self, tmp_path):
+        """Test loading metadata writes a JSON cache."""
+        (tmp_path / ".stack-meta.yaml").write_text(
+            "category: web\ntags: [prod]\npriority: 2\n"
+        )
+        stack = Stack(name="web", path=tmp_path)
+
+        stack.load_metadata()
+
+        assert stack.category == "web"
+        assert stack.tags == ["prod"]
+        assert stack.priority == 2
+        cache = json.loads(stack.meta_cache_file.read_text())
+        assert cache['meta']['category'] == "web"
+
+    def test_load_metadata_leaves_stack_dir_alone(self, tmp_path):
+        """Test the cache lives outside the stack directory."""
+        (tmp_path / ".stack-meta.yaml").write_text("category: web\n")
+        mtime_ns = tmp_path.stat().st_mtime_ns
+        stack = Stack(name="web", path=tmp_path)
+
+        stack.load_metadata()
+
+        assert os.listdir(tmp_path) == [".stack-meta.yaml"]
+        assert tmp_path.stat().st_mtime_ns == mtime_ns
+        assert stack.meta_cache_file.exists()
+
+    def test_load_metadata_ignores_other_stacks_cache(self, tmp_path):
+        """Test a cache written for another metadata file is not used."""
+        # Same-sized files, so only the recorded path tells them apart
+        for name in ("web", "api"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / ".stack-meta.yaml").write_text(
+                f"category: {name}\n"
+            )
+        web = Stack(name="web", path=tmp_path / "web")
+        api = Stack(name="api", path=tmp_path / "api")
+        web.load_metadata()
+        # Simulate a hash collision by copying web's cache over api's
+        api.meta_cache_file.write_bytes(web.meta_cache_file.read_bytes())
+        os.utime(api.meta_file, ns=(0, web.meta_file.stat().st_mtime_ns))
+
+        api.load_metadata()
+
+        assert api.category == "api"
+
+    def test_load_metadata_uses_fresh_cache(self, tmp_path):
+        """Test a fresh cache is used instead of parsing YAML."""
+        (tmp_path / ".stack-meta.yaml").write_text("category: web\n")
+        Stack(name="web", path=tmp_path).load_metadata()
+
+        stack = Stack(name="web", path=tmp_path)
+        cache = json.loads(stack.meta_cache_file.read_text())
+        cache['meta']['category'] = "cached"
+        stack.meta_cache_file.write_text(json.dumps(cache))
+
+        stack.load_metadata()
+
+        assert stack.category == "cached"
+
+    def test_load_metadata_ignores_stale_cache(self, tmp_path):
+        """Test a stale cache is replaced after the YAML changes."""
+        meta_file = tmp_path / ".stack-meta.yaml"
+        meta_file.write_text("category: web\n")
+        Stack(name="web", path=tmp_path).load_metadata()
+
+        meta_file.write_text("category: database\n")
+        stack = Stack(name="web", path=tmp_path)
+        stack.load_metadata()
+
+        assert stack.category == "database"
+
+    def test_load_metadata_ignores_unknown_keys(self, tmp_path):
+        """Test custom metadata keys are ignored."""
+        (tmp_path / ".stack-meta.yaml").write_text(
+            "category: web\nslack_channel: '#web'\n"
+        )
+        stack = Stack(name="web", path=tmp_path)
+
+        stack.load_metadata()
+
+        assert stack.category == "web"
+        assert not hasattr(stack, "slack_channel")
+
+    def test_load_metadata_ignores_reserved_keys(self, tmp_path):
+        """Test metadata can't override the name, path or internal state."""
+        (tmp_path / ".stack-meta.yaml").write_text(
+            "name: other\npath: /etc\ncompose_file: x\nmeta_found: false\n"
+        )
+        stack = Stack(name="web", path=tmp_path)
+
+        stack.load_metadata()
+
+        assert stack.name == "web"
+        assert stack.path == tmp_path
+        assert stack.meta_found is None
+
+    def test_read_metadata_uses_cache(self, tmp_path):
+        """Test raw metadata, unknown keys included, comes from the cache."""
+        (tmp_path / ".stack-meta.yaml").write_text("name: other\n")
+        Stack(name="web", path=tmp_path).load_metadata()
+
+        with patch('gam.stack._parse_yaml') as mock_parse:
+            meta = Stack(name="web", path=tmp_path).read_metadata()
+
+        mock_parse.assert_not_called()
+        assert meta == {'name': "other"}
+
+    def test_load_metadata_missing_file(self, tmp_path):
+        """Test stacks without metadata keep defaults."""
+        stack = Stack(name="web", path=tmp_path)
+
+        stack.load_metadata()
+
+        assert stack.category == "uncategorized"
+        assert not stack.meta_cache_file.exists()
+
+    def test_load_metadata_skips_stat_when_not_found(self, tmp_path):
+        """Test the file is not read when discovery found no metadata."""
+        (tmp_path / ".stack-meta.yaml").write_text("category: web\n")
+        stack = Stack(name="web", path=tmp_path, meta_found=False)
+
+        stack.load_metadata()
+
+        assert stack.category == "uncategorized"
+
+    def test_save_metadata_round_trip(self, tmp_path):
+        """Test saved metadata loads back with the same values."""
+        stack = Stack(name="web", path=tmp_path, category="app",
+                      tags=["prod", "web"], priority=3)
+
+        stack.save_metadata()
+        loaded = Stack(name="web", path=tmp_path)
+        loaded.load_metadata()
+
+        assert "tags:\n- prod\n- web\n" in stack.meta_file.read_text()
+        assert loaded.category == "app"
+        assert loaded.tags == ["prod", "web"]
+        assert loaded.priority == 3
+
+    def test_save_metadata_skips_unchanged_file(self, tmp_path):
+        """Test saving identical metadata leaves the file untouched."""
+        stack = Stack(name="web", path=tmp_path, category="app")
+        assert stack.save_metadata() is True
+        os.utime(stack.meta_file, ns=(0, 0))
+
+        assert stack.save_metadata() is False
+        assert stack.meta_file.stat().st_mtime_ns == 0
+
+        stack.category = "web"
+        assert stack.save_metadata() is True
+        assert "category: web\n" in stack.meta_file.read_text()
+
+
+class TestStackStatus:
+    """Test cases for stack status parsing."""
+
+    def _status(self, stdout):
+        """Run get_status against mocked docker compose ps output."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(stdout=stdout)
+            return stack.get_status()
+
+    def test_get_status_ndjson(self):
+        """Test parsing one JSON object per line."""
+        status = self._status(
+            '{"State": "running"}\n{"State": "exited"}\n'
+        )
+
+        assert status == {'status': 'running', 'containers': 2, 'running': 1}
+
+    def test_get_status_ndjson_blank_lines(self):
+        """Test blank and CRLF-terminated lines are tolerated."""
+        status = self._status(
+            '{"State": "running"}\r\n  \r\n{"State": "running"}\r\n'
+        )
+
+        assert status == {'status': 'running', 'containers': 2, 'running': 2}
+
+    def test_get_status_json_array(self):
+        """Test parsing a single JSON array."""
+        status = self._status('[{"State": "running"}, {"State": "running"}]')
+
+        assert status == {'status': 'running', 'containers': 2, 'running': 2}
+
+    def test_get_status_counts_exited_containers(self):
+        """Test exited containers are listed and count towards the total."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                stdout='{"State": "running"}\n{"State": "exited"}\n'
+            )
+            status = stack.get_status()
+
+        assert "--all" in mock_run.call_args.args[0]
+        assert status == {'status': 'running', 'containers': 2, 'running': 1}
+
+    def test_get_status_no_containers(self):
+        """Test empty output reports a stopped stack."""
+        status = self._status('')
+
+        assert status == {'status': 'stopped', 'containers': 0, 'running': 0}
+
+    def test_get_status_from_containers(self):
+        """Test summarizing given containers without running docker."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            status = stack.get_status([{'State': 'running'}])
+
+        mock_run.assert_not_called()
+        assert status == {'status': 'running', 'containers': 1, 'running': 1}
+
+
+class TestStackDisplay:
+    """Test cases for stack display helpers."""
+
+    def test_category_display(self):
+        """Test the subcategory is appended only when set."""
+        stack = Stack(name="web", path=Path("/fake/path/web"), category="app")
+        assert stack.category_display == "app"
+
+        stack.subcategory = "frontend"
+        assert stack.category_display == "app/frontend"
+
+
+class TestStackLifecycle:
+    """Test cases for starting and stopping stacks."""
+
+    def test_restart(self):
+        """Test restart runs a single docker compose restart."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            assert stack.restart()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][1:] == ["compose", "restart"]
+
+    def test_restart_hard(self):
+        """Test a hard restart runs down then up."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            assert stack.restart(hard=True)
+
+        commands = [c.args[0][1:] for c in mock_run.call_args_list]
+        assert commands == [["compose", "down"], ["compose", "up", "-d"]]
+
+    def test_restart_failure(self):
+        """Test a failed restart returns False."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "docker")
+            assert not stack.restart()
+
+    def test_quiet_failure_writes_captured_stderr(self, capsys):
+        """Test quiet runs capture output and show it only on failure."""
+        stack = Stack(name="web", path=Path("/fake/path/web"))
+        with patch('gam.stack.subprocess.run') as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(
+                1, "docker", stderr="no such service\n"
+            )
+            assert not stack.up(quiet=True)
+
+        assert mock_run.call_args.kwargs['capture_output'] is True
+        assert capsys.readouterr().err == "no such service\n"
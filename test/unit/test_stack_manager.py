@@ -0,0 +1,505 @@
+"""Tests for StackManager."""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gam.stack import Stack
+from gam.stack_manager import StackManager, _index_file
+
+
+class TestStackManager:
+    """Test cases for StackManager."""
+
+    def _mock_ps(self, stdout, returncode=0):
+        """Patch docker ps to write stdout and exit with returncode."""
+        proc = MagicMock(returncode=returncode)
+        proc.__enter__.return_value = proc
+        proc.stdout = io.StringIO(stdout)
+        return patch(
+            'gam.stack_manager.subprocess.Popen', return_value=proc
+        )
+
+    def test_get_statuses(self, mock_manager):
+        """Test per-stack statuses are used if docker ps fails."""
+        stacks = list(mock_manager.stacks.values())
+        for stack in stacks:
+            stack.get_status = MagicMock(
+                return_value={'status': stack.name, 'containers': 0,
+                              'running': 0}
+            )
+
+        with patch('gam.stack_manager.subprocess.Popen') as mock_popen:
+            mock_popen.side_effect = OSError
+            statuses = mock_manager.get_statuses(stacks)
+
+        assert set(statuses) == set(mock_manager.stacks)
+        for name, status in statuses.items():
+            assert status['status'] == name
+
+    def test_get_statuses_batched(self, mock_manager):
+        """Test one docker ps call provides status for many stacks."""
+        stacks = list(mock_manager.stacks.values())
+        ps_output = (
+            "/fake/path/test-stack\trunning\n"
+            "/fake/path/test-stack\trestarting\n"
+            "/fake/path/autostart-stack\trunning\n"
+        )
+
+        with self._mock_ps(ps_output) as mock_popen:
+            statuses = mock_manager.get_statuses(stacks)
+
+        mock_popen.assert_called_once()
+        # Exited containers must count towards each stack's total
+        assert "--all" in mock_popen.call_args.args[0]
+        assert statuses["test-stack"] == {
+            'status': 'running', 'containers': 2, 'running': 1
+        }
+        assert statuses["autostart-stack"]['running'] == 1
+        assert statuses["dependent-stack"]['status'] == 'stopped'
+
+    def test_get_statuses_batched_failure(self, mock_manager):
+        """Test a failed docker ps falls back to per-stack queries."""
+        stacks = list(mock_manager.stacks.values())
+        for stack in stacks:
+            stack.get_status = MagicMock(
+                return_value={'status': 'stopped', 'containers': 0,
+                              'running': 0}
+            )
+
+        with self._mock_ps("/fake/path/test-stack\trunning\n", 1):
+            statuses = mock_manager.get_statuses(stacks)
+
+        assert statuses["test-stack"]['status'] == 'stopped'
+        for stack in stacks:
+            stack.get_status.assert_called_once_with()
+
+    def test_get_statuses_batched_resolves_symlinks(self, tmp_path):
+        """Test containers match stacks reached through a symlink."""
+        for name in ("web", "db"):
+            (tmp_path / "real" / name).mkdir(parents=True)
+            (tmp_path / "real" / name / "docker-compose.yml").write_text(
+                "services: {}\n"
+            )
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        manager = StackManager(root_dir=tmp_path / "link")
+        ps_output = f"{tmp_path / 'real' / 'web'}\trunning\n"
+
+        with self._mock_ps(ps_output):
+            statuses = manager.get_statuses(list(manager.stacks.values()))
+
+        assert statuses["web"]['status'] == 'running'
+        assert statuses["db"]['status'] == 'stopped'
+
+    def test_get_statuses_empty(self, mock_manager):
+        """Test statuses for no stacks is an empty dict."""
+        assert mock_manager.get_statuses([]) == {}
+
+    def test_get_status_cached(self, mock_manager):
+        """Test status is only queried once until invalidated."""
+        stack = mock_manager.stacks["test-stack"]
+        stack.get_status = MagicMock(
+            return_value={'status': 'stopped', 'containers': 0, 'running': 0}
+        )
+
+        mock_manager.get_status(stack)
+        mock_manager.get_statuses([stack])
+        assert stack.get_status.call_count == 1
+
+        mock_manager.invalidate_status(stack)
+        mock_manager.get_status(stack)
+        assert stack.get_status.call_count == 2
+
+    def test_resolve_dependencies(self, mock_manager, mock_stack_with_deps):
+        """Test dependencies are returned without the stack itself."""
+        deps = mock_manager.resolve_dependencies(mock_stack_with_deps)
+
+        assert [s.name for s in deps] == ["test-stack"]
+
+    def test_resolve_dependencies_diamond(self, mock_manager):
+        """Test shared dependencies appear once, before their dependents."""
+        stacks = mock_manager.stacks
+        stacks["autostart-stack"].depends_on = ["test-stack"]
+        stacks["dependent-stack"].depends_on = [
+            "autostart-stack", "test-stack"
+        ]
+
+        deps = mock_manager.resolve_dependencies(stacks["dependent-stack"])
+
+        assert [s.name for s in deps] == ["test-stack", "autostart-stack"]
+
+    def test_resolve_dependencies_cycle(self, mock_manager):
+        """Test a dependency cycle raises ValueError."""
+        stacks = mock_manager.stacks
+        stacks["test-stack"].depends_on = ["dependent-stack"]
+
+        with pytest.raises(ValueError, match="cycle"):
+            mock_manager.resolve_dependencies(stacks["dependent-stack"])
+
+    def test_resolve_dependencies_cached(
+        self, mock_manager, mock_stack_with_deps
+    ):
+        """Test resolved dependencies are reused for the same stack."""
+        mock_manager.resolve_dependencies(mock_stack_with_deps)
+        mock_stack_with_deps.depends_on = []
+
+        deps = mock_manager.resolve_dependencies(mock_stack_with_deps)
+
+        assert [s.name for s in deps] == ["test-stack"]
+
+    def test_dependency_levels(self, mock_manager):
+        """Test independent stacks share a level after dependencies."""
+        stacks = list(mock_manager.stacks.values())
+
+        levels = mock_manager.dependency_levels(stacks)
+
+        assert [[s.name for s in level] for level in levels] == [
+            ["test-stack", "autostart-stack"],
+            ["dependent-stack"],
+        ]
+
+    def test_dependency_levels_cycle(self, mock_manager):
+        """Test stacks in a cycle are still returned, one per level."""
+        mock_manager.stacks["test-stack"].depends_on = ["dependent-stack"]
+        stacks = list(mock_manager.stacks.values())
+
+        levels = mock_manager.dependency_levels(stacks)
+
+        assert [[s.name for s in level] for level in levels] == [
+            ["autostart-stack"], ["test-stack"], ["dependent-stack"]
+        ]
+
+    def test_batch_stacks_by_priority_reversed(self, mock_manager):
+        """Test stop batches run from lowest to highest priority."""
+        stacks = list(mock_manager.stacks.values())
+
+        batches = mock_manager.batch_stacks(
+            stacks, by_priority=True, reverse=True
+        )
+
+        assert [[s.name for s in batch] for batch in batches] == [
+            ["test-stack"], ["dependent-stack"], ["autostart-stack"]
+        ]
+
+    def test_run_batch(self, mock_manager):
+        """Test batch results are returned in input order."""
+        stacks = list(mock_manager.stacks.values())
+
+        results = mock_manager.run_batch(
+            stacks, lambda s: s.name == "autostart-stack"
+        )
+
+        assert results == [False, True, False]
+
+    def test_run_batch_empty(self, mock_manager):
+        """Test an empty batch runs nothing."""
+        assert mock_manager.run_batch([], lambda s: True) == []
+
+    def test_get_category_stacks(self, mock_manager):
+        """Test stacks are looked up by category in discovery order."""
+        mock_manager.stacks["dependent-stack"].category = "test"
+
+        stacks = mock_manager.get_category_stacks("test")
+
+        assert [s.name for s in stacks] == ["test-stack", "dependent-stack"]
+        assert mock_manager.get_category_stacks("missing") == []
+
+    def test_get_tag_stacks(self, mock_manager):
+        """Test stacks are looked up by tag."""
+        stacks = mock_manager.get_tag_stacks("dev")
+
+        assert [s.name for s in stacks] == ["test-stack"]
+
+    def test_indexes_rebuilt_after_invalidation(self, mock_manager):
+        """Test category changes show up once indexes are invalidated."""
+        mock_manager.get_category_stacks("test")
+        mock_manager.stacks["test-stack"].category = "moved"
+
+        mock_manager.invalidate_indexes()
+
+        assert [
+            s.name for s in mock_manager.get_category_stacks("moved")
+        ] == ["test-stack"]
+
+    def test_get_autostart_stacks(self, mock_manager):
+        """Test autostart stacks come back sorted by priority."""
+        mock_manager.stacks["test-stack"].auto_start = True
+
+        stacks = mock_manager.get_autostart_stacks()
+        stacks.clear()
+
+        assert [s.name for s in mock_manager.get_autostart_stacks()] == [
+            "autostart-stack", "test-stack"
+        ]
+
+    def test_rename_tag_updates_indexes(self, mock_manager):
+        """Test renamed tags are found under their new name."""
+        for stack in mock_manager.stacks.values():
+            stack.save_metadata = MagicMock(return_value=True)
+        mock_manager.get_tag_stacks("dev")
+
+        count = mock_manager.rename_tag("dev", "development")
+
+        assert count == 1
+        assert mock_manager.get_tag_stacks("dev") == []
+        assert [s.name for s in mock_manager.get_tag_stacks("development")] == [
+            "test-stack"
+        ]
+        assert "development" in mock_manager.get_all_tags()
+
+    def test_rename_tag_keeps_position(self, mock_manager):
+        """Test a renamed tag stays where the old one was."""
+        stack = mock_manager.stacks["test-stack"]
+        stack.tags = ["dev", "testing"]
+        stack.save_metadata = MagicMock(return_value=True)
+
+        mock_manager.rename_tag("dev", "development")
+
+        assert stack.tags == ["development", "testing"]
+
+    @pytest.mark.parametrize("method,value", [
+        ("rename_tag", "dev"),
+        ("rename_category", "test"),
+    ])
+    def test_rename_to_same_name_is_noop(self, mock_manager, method, value):
+        """Test renaming to the same name saves nothing and counts 0."""
+        for stack in mock_manager.stacks.values():
+            stack.save_metadata = MagicMock(return_value=True)
+
+        assert getattr(mock_manager, method)(value, value) == 0
+        for stack in mock_manager.stacks.values():
+            stack.save_metadata.assert_not_called()
+
+    def test_rename_counts_only_written_files(self, mock_manager):
+        """Test stacks whose file was already up to date aren't counted."""
+        for stack in mock_manager.stacks.values():
+            stack.save_metadata = MagicMock(return_value=False)
+        mock_manager.stacks["test-stack"].save_metadata.return_value = True
+
+        assert mock_manager.rename_category("test", "qa") == 1
+
+    def test_search(self, mock_manager):
+        """Test search matches name, description and tags."""
+        assert [s.name for s in mock_manager.search("AUTO-START")] == [
+            "autostart-stack"
+        ]
+        assert [s.name for s in mock_manager.search("backend")] == [
+            "dependent-stack"
+        ]
+
+    def test_search_multiple_terms(self, mock_manager):
+        """Test every term must match, in any field."""
+        assert [s.name for s in mock_manager.search("test", "dev")] == [
+            "test-stack"
+        ]
+        assert mock_manager.search("test", "prod") == []
+
+    def test_search_does_not_match_across_fields(self, mock_manager):
+        """Test a term spanning two tags does not match."""
+        assert mock_manager.search("devtesting") == []
+
+
+class TestStackManagerDiscovery:
+    """Test cases for stack discovery."""
+
+    def _make_stack(self, root, name, category):
+        """Create a stack directory with compose and metadata files."""
+        stack_dir = root / name
+        stack_dir.mkdir(parents=True)
+        (stack_dir / "docker-compose.yml").write_text("services: {}\n")
+        (stack_dir / ".stack-meta.yaml").write_text(f"category: {category}\n")
+
+    def test_get_stack_loads_only_that_stack(self, tmp_path):
+        """Test get_stack loads metadata for a single stack."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, "db", "data")
+        manager = StackManager(root_dir=tmp_path)
+
+        assert manager.get_stack("web").category == "frontend"
+        unloaded = Stack(name="db", path=tmp_path / "db")
+        assert not unloaded.meta_cache_file.exists()
+
+    def test_stack_names_does_not_load_metadata(self, tmp_path):
+        """Test listing stack names leaves metadata unloaded."""
+        self._make_stack(tmp_path, "web", "frontend")
+        manager = StackManager(root_dir=tmp_path)
+
+        assert "web" in manager.stack_names
+        unloaded = Stack(name="web", path=tmp_path / "web")
+        assert not unloaded.meta_cache_file.exists()
+
+    def test_resolve_dependencies_loads_only_reachable(self, tmp_path):
+        """Test resolving dependencies leaves unrelated stacks unloaded."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, "db", "data")
+        self._make_stack(tmp_path, "other", "misc")
+        (tmp_path / "web" / ".stack-meta.yaml").write_text(
+            "category: frontend\ndepends_on: [db]\n"
+        )
+        manager = StackManager(root_dir=tmp_path)
+
+        deps = manager.resolve_dependencies(manager.get_stack("web"))
+
+        assert [s.name for s in deps] == ["db"]
+        unloaded = Stack(name="other", path=tmp_path / "other")
+        assert not unloaded.meta_cache_file.exists()
+
+    def test_stacks_loads_all_metadata(self, tmp_path):
+        """Test accessing stacks loads metadata for every stack."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, "db", "data")
+        manager = StackManager(root_dir=tmp_path)
+
+        categories = {s.name: s.category for s in manager.stacks.values()}
+
+        assert categories == {"web": "frontend", "db": "data"}
+
+    def test_discover_nested_stack_names(self, tmp_path):
+        """Test stack names are derived from the relative path."""
+        self._make_stack(tmp_path, "video/transcoding", "video")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert list(manager.stacks) == ["video-transcoding"]
+
+    def test_discover_skips_hidden_directories(self, tmp_path):
+        """Test stacks inside hidden directories are ignored."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, ".archive/old", "old")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert list(manager.stacks) == ["web"]
+
+    def test_discover_does_not_search_inside_stacks(self, tmp_path):
+        """Test directories inside a stack are not searched."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, "web/build", "build")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert list(manager.stacks) == ["web"]
+
+    def test_discover_deep_scan_finds_nested_stacks(self, tmp_path):
+        """Test deep_scan also searches inside stacks."""
+        self._make_stack(tmp_path, "web", "frontend")
+        self._make_stack(tmp_path, "web/build", "build")
+
+        manager = StackManager(root_dir=tmp_path, deep_scan=True)
+
+        assert list(manager.stacks) == ["web", "web-build"]
+
+    def test_discover_records_file_presence(self, tmp_path):
+        """Test discovery records compose and metadata file presence."""
+        self._make_stack(tmp_path, "web", "frontend")
+        (tmp_path / "db").mkdir()
+        (tmp_path / "db" / "docker-compose.yml").write_text("services: {}\n")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert manager.stacks["web"].compose_found
+        assert manager.stacks["web"].meta_found
+        assert not manager.stacks["db"].meta_found
+
+    def test_discover_other_compose_file_names(self, tmp_path):
+        """Test compose.yaml and friends are found, preferred like docker."""
+        for name, files in [
+            ("api", ["compose.yml"]),
+            ("db", ["docker-compose.yaml"]),
+            ("web", ["docker-compose.yml", "compose.yaml"]),
+        ]:
+            (tmp_path / name).mkdir()
+            for file_name in files:
+                (tmp_path / name / file_name).write_text("services: {}\n")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert {
+            name: stack.compose_file.name
+            for name, stack in manager.stacks.items()
+        } == {
+            "api": "compose.yml",
+            "db": "docker-compose.yaml",
+            "web": "compose.yaml",
+        }
+
+    def test_discover_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test symlinked directories are not searched, avoiding loops."""
+        self._make_stack(tmp_path, "stacks/web", "frontend")
+        (tmp_path / "stacks" / "loop").symlink_to(tmp_path)
+        (tmp_path / "alias").symlink_to(tmp_path / "stacks" / "web")
+
+        manager = StackManager(root_dir=tmp_path)
+
+        assert list(manager.stacks) == ["stacks-web"]
+
+
+class TestStackManagerIndex:
+    """Test cases for the on-disk discovery index."""
+
+    def _make_stack(self, root, name):
+        """Create a stack directory with a compose file."""
+        stack_dir = root / name
+        stack_dir.mkdir(parents=True)
+        (stack_dir / "docker-compose.yml").write_text("services: {}\n")
+
+    def _age(self, root):
+        """Backdate every directory under root by an hour."""
+        old = os.stat(root).st_mtime - 3600
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, (old, old))
+
+    def test_index_reused_when_unchanged(self, tmp_path):
+        """Test an unchanged tree is discovered from the index."""
+        self._make_stack(tmp_path, "web")
+        self._age(tmp_path)
+        StackManager(root_dir=tmp_path)
+        assert _index_file(str(tmp_path)).exists()
+
+        with patch('gam.stack_manager._find_stack_dirs') as mock_find:
+            manager = StackManager(root_dir=tmp_path)
+
+        mock_find.assert_not_called()
+        assert list(manager.stacks) == ["web"]
+
+    def test_index_invalidated_by_new_stack(self, tmp_path):
+        """Test adding a stack directory is noticed."""
+        self._make_stack(tmp_path, "group/web")
+        self._age(tmp_path)
+        StackManager(root_dir=tmp_path)
+
+        self._make_stack(tmp_path, "group/db")
+        manager = StackManager(root_dir=tmp_path)
+
+        assert list(manager.stacks) == ["group-db", "group-web"]
+
+    def test_index_invalidated_by_new_metadata(self, tmp_path):
+        """Test adding a metadata file to a stack is noticed."""
+        self._make_stack(tmp_path, "web")
+        self._age(tmp_path)
+        StackManager(root_dir=tmp_path)
+
+        (tmp_path / "web" / ".stack-meta.yaml").write_text("category: app\n")
+        manager = StackManager(root_dir=tmp_path)
+
+        assert manager.stacks["web"].category == "app"
+
+    def test_index_not_written_for_recent_changes(self, tmp_path):
+        """Test directories changed just now are not indexed."""
+        self._make_stack(tmp_path, "web")
+
+        StackManager(root_dir=tmp_path)
+
+        assert not _index_file(str(tmp_path)).exists()
+
+    def test_index_disabled(self, tmp_path, monkeypatch):
+        """Test GAM_NO_CACHE skips the index."""
+        monkeypatch.setenv("GAM_NO_CACHE", "1")
+        self._make_stack(tmp_path, "web")
+        self._age(tmp_path)
+
+        StackManager(root_dir=tmp_path)
+
+        assert not _index_file(str(tmp_path)).exists()
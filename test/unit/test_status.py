@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from gam.commands.status import cmd_status
 
 
@@ -10,17 +12,13 @@ class TestStatusCommand:
 
     def test_status_all_stacks(self, mock_manager, mock_args, capsys):
         """Test status of all stacks."""
-        mock_manager.list_stacks = MagicMock(
-            return_value=list(mock_manager.stacks.values())
+        stacks = list(mock_manager.stacks.values())
+        mock_manager.list_stacks = MagicMock(return_value=stacks)
+        # One status map for every stack, without running docker ps
+        running = {'status': 'running', 'containers': 2, 'running': 1}
+        mock_manager.get_statuses = MagicMock(
+            return_value={stack.name: running for stack in stacks}
         )
-        for stack in mock_manager.stacks.values():
-            stack.get_status = MagicMock(
-                return_value={
-                    'status': 'running',
-                    'containers': 2,
-                    'running': 1
-                }
-            )
 
         cmd_status(mock_manager, mock_args)
 
@@ -49,33 +47,28 @@ class TestStatusCommand:
         assert "autostart-stack" in captured.out
         assert "production" in captured.out
 
-    def test_status_shows_icons(self, mock_manager, mock_args, capsys):
-        """Test status shows correct icons."""
-        mock_manager.list_stacks = MagicMock(
-            return_value=[mock_manager.stacks["test-stack"]]
-        )
-        mock_manager.stacks["test-stack"].get_status = MagicMock(
-            return_value={'status': 'running', 'containers': 1, 'running': 1}
-        )
-
-        cmd_status(mock_manager, mock_args)
-
-        captured = capsys.readouterr()
-        assert "●" in captured.out  # Running icon
-
-    def test_status_stopped_icon(self, mock_manager, mock_args, capsys):
-        """Test status shows stopped icon."""
+    @pytest.mark.parametrize(
+        "state,running,icon",
+        [("running", 1, "●"), ("stopped", 0, "○")],
+        ids=["running", "stopped"],
+    )
+    def test_status_icon(
+        self, mock_manager, mock_args, capsys, state, running, icon
+    ):
+        """Test status shows the icon for the stack's state."""
         mock_manager.list_stacks = MagicMock(
             return_value=[mock_manager.stacks["test-stack"]]
         )
         mock_manager.stacks["test-stack"].get_status = MagicMock(
-            return_value={'status': 'stopped', 'containers': 0, 'running': 0}
+            return_value={
+                'status': state, 'containers': running, 'running': running
+            }
         )
 
         cmd_status(mock_manager, mock_args)
 
         captured = capsys.readouterr()
-        assert "○" in captured.out  # Stopped icon
+        assert icon in captured.out
 
     def test_status_filter_by_tag(self, mock_manager, mock_args, capsys):
         """Test status filtered by tag."""
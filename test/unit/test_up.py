@@ -47,32 +47,32 @@ class TestUpCommand:
         captured = capsys.readouterr()
         assert "Starting 3 stack(s)" in captured.out
 
-    def test_up_by_category(self, mock_manager, mock_args, capsys):
-        """Test starting stacks by category."""
-        mock_args.category = "production"
-        mock_manager.get_category_stacks = MagicMock(
-            return_value=[mock_manager.stacks["autostart-stack"]]
-        )
-        mock_manager.stacks["autostart-stack"].up = MagicMock(
-            return_value=True
-        )
-
-        cmd_up(mock_manager, mock_args)
-
-        captured = capsys.readouterr()
-        assert "Starting 1 stack(s)" in captured.out
-
-    def test_up_by_tag(self, mock_manager, mock_args, capsys):
-        """Test starting stacks by tag."""
-        mock_args.tag = "dev"
-        mock_manager.stacks["test-stack"].up = MagicMock(return_value=True)
+    @pytest.mark.parametrize(
+        "filter_attr,filter_value,stack_name",
+        [
+            ("category", "production", "autostart-stack"),
+            ("tag", "dev", "test-stack"),
+        ],
+        ids=["category", "tag"],
+    )
+    def test_up_by_filter(
+        self, mock_manager, mock_args, capsys,
+        filter_attr, filter_value, stack_name
+    ):
+        """Test starting stacks by category or tag."""
+        setattr(mock_args, filter_attr, filter_value)
+        stack = mock_manager.stacks[stack_name]
+        stack.up = MagicMock(return_value=True)
 
         cmd_up(mock_manager, mock_args)
 
         captured = capsys.readouterr()
         assert "Starting 1 stack(s)" in captured.out
+        stack.up.assert_called_once()
 
-    def test_up_with_priority(self, mock_manager, mock_args, capsys):
+    def test_up_with_priority(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
         """Test starting stacks with priority ordering."""
         mock_args.all = True
         mock_args.priority = True
@@ -83,9 +83,7 @@ class TestUpCommand:
 
         captured = capsys.readouterr()
         # Priority 1 should start before priority 3
-        assert captured.out.index("autostart-stack") < captured.out.index(
-            "test-stack"
-        )
+        assert_order(captured.out, "autostart-stack", "test-stack")
 
     def test_up_with_dependencies(self, mock_manager, mock_args, capsys):
         """Test starting stack with dependencies."""
@@ -94,6 +92,9 @@ class TestUpCommand:
         mock_manager.resolve_dependencies = MagicMock(
             return_value=[mock_manager.stacks["test-stack"]]
         )
+        mock_manager.get_statuses = MagicMock(return_value={
+            "test-stack": {'status': 'stopped', 'containers': 0, 'running': 0}
+        })
         for stack in mock_manager.stacks.values():
             stack.up = MagicMock(return_value=True)
 
@@ -102,6 +103,51 @@ class TestUpCommand:
         captured = capsys.readouterr()
         assert "Starting 2 stack(s)" in captured.out
 
+    def test_up_with_dependencies_skips_running(
+        self, mock_manager, mock_args, capsys
+    ):
+        """Test dependencies that are already running aren't started."""
+        mock_args.target = "dependent-stack"
+        mock_args.with_deps = True
+        mock_manager.resolve_dependencies = MagicMock(
+            return_value=[mock_manager.stacks["test-stack"]]
+        )
+        mock_manager.get_statuses = MagicMock(return_value={
+            "test-stack": {'status': 'running', 'containers': 2, 'running': 2}
+        })
+        for stack in mock_manager.stacks.values():
+            stack.up = MagicMock(return_value=True)
+
+        cmd_up(mock_manager, mock_args)
+
+        captured = capsys.readouterr()
+        assert "Starting 1 stack(s)" in captured.out
+        assert "Skipping test-stack (already running)" in captured.out
+        mock_manager.stacks["test-stack"].up.assert_not_called()
+        mock_manager.stacks["dependent-stack"].up.assert_called_once()
+
+    def test_up_with_dependencies_starts_partly_running(
+        self, mock_manager, mock_args, capsys
+    ):
+        """Test a dependency with an exited container is started again."""
+        mock_args.target = "dependent-stack"
+        mock_args.with_deps = True
+        mock_manager.resolve_dependencies = MagicMock(
+            return_value=[mock_manager.stacks["test-stack"]]
+        )
+        mock_manager.get_statuses = MagicMock(return_value={
+            "test-stack": {'status': 'running', 'containers': 2, 'running': 1}
+        })
+        for stack in mock_manager.stacks.values():
+            stack.up = MagicMock(return_value=True)
+
+        cmd_up(mock_manager, mock_args)
+
+        captured = capsys.readouterr()
+        assert "Starting 2 stack(s)" in captured.out
+        assert "Skipping" not in captured.out
+        mock_manager.stacks["test-stack"].up.assert_called_once()
+
     def test_up_failure(self, mock_manager, mock_args, capsys):
         """Test up when stack fails to start."""
         mock_args.target = "test-stack"
@@ -113,3 +159,47 @@ class TestUpCommand:
 
         captured = capsys.readouterr()
         assert "✗ FAILED" in captured.out
+
+    def test_up_with_dependency_cycle(self, mock_manager, mock_args, capsys):
+        """Test up with dependencies fails on a dependency cycle."""
+        mock_args.target = "dependent-stack"
+        mock_args.with_deps = True
+        mock_manager.stacks["test-stack"].depends_on = ["dependent-stack"]
+
+        with pytest.raises(SystemExit):
+            cmd_up(mock_manager, mock_args)
+
+        captured = capsys.readouterr()
+        assert "Dependency cycle detected" in captured.out
+
+    def test_up_all_starts_dependencies_first(
+        self, mock_manager, mock_args, capsys, assert_order
+    ):
+        """Test dependencies start before the stacks that need them."""
+        mock_args.all = True
+        mock_manager.stacks = {
+            name: mock_manager.stacks[name]
+            for name in ("dependent-stack", "test-stack")
+        }
+        for stack in mock_manager.stacks.values():
+            stack.up = MagicMock(return_value=True)
+
+        cmd_up(mock_manager, mock_args)
+
+        captured = capsys.readouterr()
+        assert_order(captured.out, "test-stack", "dependent-stack")
+
+    def test_up_concurrent_batch_is_quiet(
+        self, mock_manager, mock_args, capsys
+    ):
+        """Test stacks started together capture their compose output."""
+        mock_args.all = True
+        for stack in mock_manager.stacks.values():
+            stack.up = MagicMock(return_value=True)
+
+        cmd_up(mock_manager, mock_args)
+
+        stacks = mock_manager.stacks
+        stacks["test-stack"].up.assert_called_once_with(quiet=True)
+        stacks["autostart-stack"].up.assert_called_once_with(quiet=True)
+        stacks["dependent-stack"].up.assert_called_once_with(quiet=False)